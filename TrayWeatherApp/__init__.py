@@ -1,7 +1,22 @@
 # TrayWeatherApp module: __init__.py
 
-from .app import TrayWeatherApp
-from .theme import ThemeManager
-from .weather import WeatherWindow
-from .settings import SettingsDialog
+import importlib
+
+# the GUI classes are imported on first access so headless users (engine, CLI) never load PyQt6
+_LAZY = {
+    'GlassCard': 'ui_components',
+    'SettingsDialog': 'settings',
+    'ThemeManager': 'theme',
+    'TrayWeatherApp': 'app',
+    'WeatherWindow': 'weather',
+    'WeatherWorker': 'workers',
+}
 __all__ = ['GlassCard', 'SettingsDialog', 'ThemeManager', 'TrayWeatherApp', 'WeatherWindow', 'WeatherWorker']
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,8 +1,18 @@
 # TrayWeatherApp module: __main__.py
 
-from TrayWeatherApp.app import TrayWeatherApp
+import os, sys
 
 if __name__ == '__main__':
+    from TrayWeatherApp import startup
+    if len(sys.argv) > 1 and sys.argv[1] == "fetch":
+        from TrayWeatherApp.cli import main
+        sys.exit(main(sys.argv[1:]))
+    if startup.REPORT_FLAG in sys.argv:
+        sys.exit(startup.report(sys.argv[1:]))
+    from TrayWeatherApp.app import TrayWeatherApp
     app = TrayWeatherApp()
     app.theme.apply_to_app(app.app)
-    app.app.exec()
+    code = app.app.exec()
+    if startup.exit_requested():
+        # report child: quit_app already flushed config and log, don't wait on in-flight requests
+        os._exit(code)
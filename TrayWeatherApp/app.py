@@ -1,15 +1,17 @@
 # TrayWeatherApp module: app.py
 
 from datetime import datetime, timezone, timedelta
-from PyQt6.QtCore import QTimer, QThread
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from TrayWeatherApp.config_utils import log, load_config, save_config
-from TrayWeatherApp.config_utils import log, load_config, save_config, CONFIG_PATH, THEMES_DIR, DEFAULT_CONFIG, zipfile, create_tray_icon
-from TrayWeatherApp.settings import SettingsDialog
+from TrayWeatherApp.config_utils import log, config_store, THEMES_DIR, create_tray_icon
+from TrayWeatherApp.config_utils import set_log_debug, flush_log, prewarm_icons
+from TrayWeatherApp.cache import forecast_cache
+from TrayWeatherApp.scheduler import RefreshScheduler
 from TrayWeatherApp.theme import ThemeManager
-from TrayWeatherApp.weather import WeatherWindow
-from TrayWeatherApp.workers import WeatherWorker
-import sys, io, json
+from TrayWeatherApp.metrics import metrics, timed
+from TrayWeatherApp import startup, units
+import sys, io, json, zipfile
 
 # ---------- Main App ----------
 class TrayWeatherApp:
@@ -18,6 +20,7 @@ class TrayWeatherApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
+        startup.mark("qapplication")
         self.theme = ThemeManager()
         self.load_config()
 
@@ -29,30 +32,68 @@ class TrayWeatherApp:
             log(f"Theme load failed: {e}", "ERROR")
         self.theme.apply_to_app(self.app)
 
-        self.window = WeatherWindow(self)
+        # only the tray is built here; the window, tabs and network work wait for the event loop
+        self.window = None
+        self.fetcher = None
+        self.diagnostics = None
+        self.metrics_timer = QTimer()
+        self.metrics_timer.timeout.connect(self.dump_metrics)
+        self.configure_metrics_dump()
         self.tray = QSystemTrayIcon(create_tray_icon("☀️"))
         self.tray.setToolTip("TrayWeatherApp")
         self.tray.activated.connect(self.on_tray_activated)
         menu = QMenu()
         menu.addAction("Show/Hide Window", self.toggle_window)
+        menu.addAction("Overview List", self.show_overview)
         menu.addAction("Refresh", self.fetch_weather_now)
         menu.addAction("Settings", self.open_settings)
+        menu.addAction("Diagnostics", self.open_diagnostics)
         menu.addAction("Quit", self.quit_app)
         self.tray.setContextMenu(menu)
         self.tray.show()
-        self.jobs = {}
+        startup.mark("tray_visible")
+        QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        if self.window is not None:
+            return
+        startup.mark("event_loop_running")
+        # heavy modules (requests, the window and card widgets) are imported only now
+        from TrayWeatherApp.weather import WeatherWindow
+        from TrayWeatherApp.workers import FetchExecutor, FETCH_CONCURRENCY, weather_icons
+        startup.mark("deferred_imports")
+
+        self.window = WeatherWindow(self)
+        self.fetcher = FetchExecutor(self.config.get("fetch_concurrency", FETCH_CONCURRENCY))
+        self.fetcher.finished.connect(self.on_fetch_result)
+        self.fetcher.error.connect(self.on_fetch_error)
+        self.fetcher.job_done.connect(lambda _: forecast_cache.schedule_flush())
+        self.fetcher.followup.connect(self.on_followup)
+        self.scheduler = RefreshScheduler(self.REFRESH_INTERVAL_MS / 1000)
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_refresh_tick)
         for city in self.cities:
             self.window.add_city_tab(city)
-            self.fetch_weather_city(city)
+            cached = forecast_cache.get(city, units.CANONICAL)
+            if cached:
+                self.window.update_city_tab(city, cached)
         self.window.add_fake_tab()
-        self.timer = QTimer()
-        self.timer.setInterval(self.REFRESH_INTERVAL_MS)
-        self.timer.timeout.connect(self.fetch_weather_now)
-        self.timer.start()
+        self.window.set_view_mode(self.config.get("view_mode", "tabs"))
+        startup.mark("window_built")
+        if startup.exit_requested():
+            # the startup report child runs against the user's real HOME: no requests, no saves
+            startup.dump_marks()
+            QTimer.singleShot(0, self.app.quit)
+            return
+        self.fetch_weather_now()
+        startup.mark("fetch_submitted")
+        QTimer.singleShot(0, lambda: prewarm_icons(weather_icons()))
 
     def ensure_example_themes(self):
         if list(THEMES_DIR.glob("*.zip")):
             return
+        THEMES_DIR.mkdir(parents=True, exist_ok=True)
         log("No themes found; generating example themes (dark, light, solarized)")
         def make_theme_zip(name, css_text, json_dict):
             buf = io.BytesIO()
@@ -191,31 +232,26 @@ QCheckBox { spacing: 8px; }
         pack("solarized", base_qss, sol_json)
 
     def load_config(self):
-        self.config = DEFAULT_CONFIG.copy()
-        if CONFIG_PATH.exists():
-            try:
-                self.config.update(json.loads(CONFIG_PATH.read_text(encoding="utf-8")))
-            except Exception as e:
-                log(f"Config load failed: {e}", "ERROR")
-        self.cities  = self.config.get("cities", ["New York"])
+        self.config = config_store.load()
+        set_log_debug(self.config.get("debug", False))
+        self.cities  = list(self.config.get("cities", ["New York"]))
         self.units   = self.config.get("units", "imperial")
         self.time_format_24h = self.config.get("time_format_24h", False)
+        metrics.set_enabled(self.config.get("metrics_enabled", False))
 
     def save_config(self):
+        # only marks changed keys dirty; ConfigStore writes them once the burst settles
         self.config.update({
-            "cities": self.cities,
+            "cities": list(self.cities),
             "units": self.units,
             "time_format_24h": self.time_format_24h,
             "theme": self.config.get("theme", "dark"),
         })
-        try:
-            CONFIG_PATH.write_text(json.dumps(self.config, indent=2), encoding="utf-8")
-        except Exception as e:
-            log(f"Config save error: {e}", "ERROR")
 
+    @timed("theme.apply")
     def apply_theme_now(self):
         self.theme.apply_to_app(self.app)
-        if hasattr(self, "window"):
+        if self.window is not None:
             self.window.retheme()
             for data in self.window.city_tabs.values():
                 self.window.update_card_time(data["card"])
@@ -233,34 +269,92 @@ QCheckBox { spacing: 8px; }
         self.toggle_window()
 
     def fetch_weather_now(self):
-        for city in list(self.cities):
-            self.fetch_weather_city(city)
+        self.finish_startup()
+        self.fetch_cities(self.refresh_tier())
 
-    def fetch_weather_city(self, city: str):
-        if city in self.jobs:
+    def refresh_tier(self) -> list[str]:
+        # while the window is hidden only the tray city is kept fresh; the rest are served from cache
+        if self.window.isVisible() and not self.window.isMinimized():
+            return self.window.refresh_order()
+        return self.cities[:1]
+
+    def on_window_shown(self):
+        # catch up on the cities that went stale while hidden, the one on screen first
+        if self.fetcher is None:
+            return
+        self.scheduler.sync(self.cities)
+        due = self.scheduler.pop_due(self.window.refresh_order())
+        if not due:
             return
-        worker = WeatherWorker(city, self.units)
-        thread = QThread()
-        worker.moveToThread(thread)
-        self.jobs[city] = {"thread": thread, "worker": worker}
-        thread.started.connect(worker.run)
-        worker.finished.connect(lambda c, info: QTimer.singleShot(0, lambda: self.window.update_city_tab(c, info)))
-        worker.error.connect(lambda c, msg: QTimer.singleShot(0, lambda: self.window.update_city_tab(c, {"desc": msg})))
-        def _cleanup(): self.cleanup_job(city)
-        worker.finished.connect(_cleanup); worker.error.connect(_cleanup)
-        thread.start()
-
-    def cleanup_job(self, city: str):
-        obj = self.jobs.pop(city, None)
-        if obj:
-            worker, t = obj["worker"], obj["thread"]
-            t.quit(); t.wait(150)
-            try: worker.deleteLater()
-            except Exception: pass
-            try: t.deleteLater()
-            except Exception: pass
+        log(f"Window shown, refreshing {len(due)} stale cities")
+        self.fetch_cities(due[:1])
+        if len(due) > 1:
+            self.fetch_cities(due[1:])
+
+    def fetch_cities(self, cities: list[str]):
+        self.scheduler.sync(self.cities)
+        self.scheduler.mark_in_flight(cities)
+        if self.config.get("batch_fetch", True) and len(cities) > 1:
+            self.fetch_weather_batch(cities)
+        else:
+            for city in cities:
+                self.fetcher.submit_city(city)
+        self.schedule_next_refresh()
+
+    def on_refresh_tick(self):
+        self.scheduler.sync(self.cities)
+        due = self.scheduler.pop_due(self.refresh_tier())
+        if due:
+            log(f"Scheduled refresh of {len(due)} cities")
+            self.fetch_cities(due)
+        else:
+            self.schedule_next_refresh()
+
+    def schedule_next_refresh(self):
+        wait = self.scheduler.seconds_until_next(self.refresh_tier())
+        if wait is None:
+            wait = self.REFRESH_INTERVAL_MS / 1000
+        self.timer.start(int(min(max(wait, 1.0) * 1000, self.REFRESH_INTERVAL_MS)))
+
+    def on_fetch_result(self, city: str, info: dict):
+        self.scheduler.on_success(city)
+        self.schedule_next_refresh()
+        forecast_cache.put(city, info, units.CANONICAL)
+        self.window.update_city_tab(city, info)
+
+    def on_fetch_error(self, city: str, msg: str):
+        self.scheduler.on_failure(city)
+        self.schedule_next_refresh()
+        log(f"Fetch failed for {city}: {msg}", "ERROR")
+        prev = self.window.city_tabs.get(city, {}).get("info") or forecast_cache.get(city, units.CANONICAL)
+        if prev and prev.get("temp") is not None:
+            # keep showing the last good observation, flagged with the error
+            self.window.update_city_tab(city, {**prev, "error": msg})
+        else:
+            self.window.update_city_tab(city, {"desc": msg})
+
+    def on_followup(self, cities: list[str]):
+        # tabs closed while their fetch was running are not fetched again
+        cities = [c for c in cities if c in self.cities]
+        if cities:
+            self.fetch_cities(cities)
+
+    def fetch_weather_batch(self, cities: list[str]):
+        from TrayWeatherApp.workers import BATCH_CHUNK_SIZE
+        chunk = self.config.get("batch_chunk_size", BATCH_CHUNK_SIZE)
+        self.fetcher.submit_batch(cities, chunk)
+
+    def fetch_weather_city(self, city: str):
+        self.fetch_cities([city])
+
+    def show_overview(self):
+        self.finish_startup()
+        self.window.set_view_mode("list")
+        if not self.window.isVisible():
+            self.toggle_window()
 
     def toggle_window(self):
+        self.finish_startup()
         if self.window.isVisible():
             self.window.hide()
         else:
@@ -277,9 +371,12 @@ QCheckBox { spacing: 8px; }
                 log(f"Window state activation failed: {e}", "DEBUG")
 
     def open_settings(self):
+        from TrayWeatherApp.settings import SettingsDialog
+        self.finish_startup()
         dlg = SettingsDialog(self.config, self.theme)
         if dlg.exec():
             vals = dlg.get_values()
+            units_changed = vals["units"] != self.units
             self.units   = vals["units"]
             if vals["theme"]:
                 self.config["theme"] = vals["theme"]
@@ -289,14 +386,55 @@ QCheckBox { spacing: 8px; }
                     log(f"Theme reload failed: {e}", "ERROR")
                 self.apply_theme_now()
             self.config["debug"] = vals["debug"]
+            set_log_debug(vals["debug"])
             self.config["time_format_24h"] = vals["time_format_24h"]
             self.time_format_24h = vals["time_format_24h"]
             self.save_config()
             for data in self.window.city_tabs.values():
                 self.window.update_card_time(data["card"])
-            self.fetch_weather_now()
+            # everything in this dialog is display-only, so Settings never refetches
+            if units_changed:
+                self.window.rerender()
+
+    def open_diagnostics(self):
+        from TrayWeatherApp.diagnostics import DiagnosticsWindow
+        self.finish_startup()
+        if self.diagnostics is None:
+            self.diagnostics = DiagnosticsWindow(self)
+        self.diagnostics.show()
+        self.diagnostics.raise_()
+        self.diagnostics.activateWindow()
+
+    def set_metrics_enabled(self, enabled: bool):
+        self.config["metrics_enabled"] = bool(enabled)
+        metrics.set_enabled(enabled)
+        self.configure_metrics_dump()
+
+    def configure_metrics_dump(self):
+        path = self.config.get("metrics_dump_path")
+        if metrics.enabled and path:
+            self.metrics_timer.start(max(5, int(self.config.get("metrics_dump_interval_s", 60))) * 1000)
+        else:
+            self.metrics_timer.stop()
+
+    def dump_metrics(self):
+        path = self.config.get("metrics_dump_path")
+        if not path:
+            return
+        try:
+            metrics.dump(path)
+        except Exception as e:
+            log(f"Metrics dump to {path} failed: {e}", "ERROR")
 
     def quit_app(self):
+        if metrics.enabled:
+            self.dump_metrics()
+        if self.window is None:
+            # quit before the deferred startup ran: nothing beyond the config to persist
+            self.config.flush()
+            flush_log()
+            self.app.quit()
+            return
         log("Saving window geometry and city order before quitting")
         self.window.save_window_geometry()
 
@@ -304,17 +442,19 @@ QCheckBox { spacing: 8px; }
             ordered = self.window.get_tab_city_order()
             self.cities = [c for c in ordered if c in self.cities]
             if ordered:
-                self.config["cities"] = self.cities
+                self.config["cities"] = list(self.cities)
                 log(f"Saved tab order: {self.cities}")
             else:
                 log("No city tabs found to save", "DEBUG")
         except Exception as e:
             log(f"Failed to save tab order: {e}", "ERROR")
 
-        for city in list(self.jobs.keys()):
-            self.cleanup_job(city)
+        self.fetcher.shutdown()
+        forecast_cache.flush()
 
         self.save_config()
+        self.config.flush()
+        flush_log()
         self.app.quit()
 
     def run(self):
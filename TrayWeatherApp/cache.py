@@ -0,0 +1,201 @@
+# TrayWeatherApp module: cache.py
+
+from pathlib import Path
+from TrayWeatherApp.common import log, atomic_write_text, GEOCODE_CACHE_PATH, FORECAST_CACHE_PATH
+import atexit, json, threading, time
+
+# ---------- Geocode Cache ----------
+class GeocodeCache:
+    TTL_SECONDS = 30 * 24 * 3600
+    MAX_ENTRIES = 500
+    FIELDS = ("latitude", "longitude", "name", "country_code", "country", "timezone")
+
+    def __init__(self, path: Path, ttl: float = TTL_SECONDS, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._saved_hits = 0
+        self._saved_misses = 0
+        self.dirty = False
+        self._entries = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def normalize(city: str) -> str:
+        return " ".join(city.split()).casefold()
+
+    def _read_disk(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}, {}
+        except Exception as e:
+            log(f"Geocode cache unreadable, starting empty: {e}", "ERROR")
+            return {}, {}
+        if not isinstance(data, dict):
+            return {}, {}
+        return data.get("entries", {}), data.get("stats", {})
+
+    def _ensure_loaded(self):
+        if self._entries is None:
+            self._entries, _ = self._read_disk()
+
+    def get(self, city: str):
+        key = self.normalize(city)
+        now = time.time()
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry and now - entry.get("stored", 0) < self.ttl:
+                entry["used"] = now
+                self.hits += 1
+                return dict(entry["loc"])
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def put(self, city: str, loc: dict):
+        key = self.normalize(city)
+        now = time.time()
+        entry = {
+            "loc": {k: loc[k] for k in self.FIELDS if k in loc},
+            "stored": now,
+            "used": now,
+        }
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = entry
+            self.dirty = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries or {})
+        return {"hits": self.hits, "misses": self.misses, "entries": size}
+
+    def flush(self, stats: bool = False):
+        # one merge and atomic write for everything put since the last flush; fetch jobs call this
+        # when they finish, and hit/miss counters alone are only written when stats=True (at exit)
+        with self._lock:
+            counted = (self.hits, self.misses) != (self._saved_hits, self._saved_misses)
+            if not self.dirty and not (stats and counted):
+                return
+        with self._write_lock:
+            # disk is read outside the main lock so lookups from pool threads never wait on it
+            disk_entries, disk_stats = self._read_disk()
+            now = time.time()
+            with self._lock:
+                self._ensure_loaded()
+                # merge with whatever another process wrote since we loaded, newest entry wins
+                for key, entry in disk_entries.items():
+                    mine = self._entries.get(key)
+                    if mine is None or entry.get("stored", 0) > mine.get("stored", 0):
+                        self._entries[key] = entry
+                for key in [k for k, e in self._entries.items() if now - e.get("stored", 0) >= self.ttl]:
+                    del self._entries[key]
+                if len(self._entries) > self.max_entries:
+                    by_use = sorted(self._entries, key=lambda k: self._entries[k].get("used", 0))
+                    for key in by_use[:len(self._entries) - self.max_entries]:
+                        del self._entries[key]
+                hits, misses = self.hits, self.misses
+                payload = json.dumps({
+                    "version": 1,
+                    "entries": self._entries,
+                    "stats": {
+                        "hits": disk_stats.get("hits", 0) + hits - self._saved_hits,
+                        "misses": disk_stats.get("misses", 0) + misses - self._saved_misses,
+                    },
+                }, indent=1)
+                size = len(self._entries)
+                self.dirty = False
+            try:
+                atomic_write_text(self.path, payload)
+            except Exception as e:
+                log(f"Geocode cache save failed: {e}", "ERROR")
+                with self._lock:
+                    self.dirty = True
+                return
+            self._saved_hits, self._saved_misses = hits, misses
+        log(f"Geocode cache saved ({size} entries, session hits={hits} misses={misses})")
+
+# ---------- Forecast Cache ----------
+class ForecastCache:
+    MAX_AGE_SECONDS = 7 * 24 * 3600
+    SAVE_DELAY = 1.0
+
+    def __init__(self, path: Path, max_age: float = MAX_AGE_SECONDS, delay: float = SAVE_DELAY):
+        self.path = path
+        self.max_age = max_age
+        self.delay = delay
+        self.dirty = False
+        self._entries = None
+        self._timer = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        if self._entries is not None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._entries = data.get("entries", {}) if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            self._entries = {}
+        except Exception as e:
+            log(f"Forecast cache unreadable, starting empty: {e}", "ERROR")
+            self._entries = {}
+
+    def get(self, city: str, units: str | None = None):
+        key = GeocodeCache.normalize(city)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+        if not entry or time.time() - entry.get("fetched_at", 0) >= self.max_age:
+            return None
+        if units is not None and entry.get("units") != units:
+            return None
+        return dict(entry["info"])
+
+    def put(self, city: str, info: dict, units: str):
+        key = GeocodeCache.normalize(city)
+        entry = {"info": info, "units": units, "fetched_at": info.get("fetched_at", time.time())}
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = entry
+            self.dirty = True
+
+    def schedule_flush(self):
+        # debounced like ConfigStore saves: the dump and fsync run on a timer thread, never the GUI thread
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self.dirty:
+                    return
+                now = time.time()
+                for key in [k for k, e in self._entries.items() if now - e.get("fetched_at", 0) >= self.max_age]:
+                    del self._entries[key]
+                payload = json.dumps({"version": 1, "entries": self._entries})
+                self.dirty = False
+            try:
+                atomic_write_text(self.path, payload)
+            except Exception as e:
+                log(f"Forecast cache save failed: {e}", "ERROR")
+                with self._lock:
+                    self.dirty = True
+
+geocode_cache = GeocodeCache(GEOCODE_CACHE_PATH)
+atexit.register(geocode_cache.flush, stats=True)
+forecast_cache = ForecastCache(FORECAST_CACHE_PATH)
@@ -0,0 +1,34 @@
+# TrayWeatherApp module: cli.py
+
+from TrayWeatherApp.common import DEFAULT_CONFIG, flush_log
+from TrayWeatherApp.engine import fetch_many, BATCH_CHUNK_SIZE, FETCH_CONCURRENCY
+from TrayWeatherApp.units import localize_info
+import argparse, json, sys, time
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m TrayWeatherApp", description="Headless Open-Meteo fetcher")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fetch = sub.add_parser("fetch", help="fetch current weather for one or more cities and print JSON")
+    fetch.add_argument("cities", nargs="+", metavar="CITY")
+    fetch.add_argument("--units", choices=("metric", "imperial"), default=DEFAULT_CONFIG["units"])
+    fetch.add_argument("-j", "--concurrency", type=int, default=FETCH_CONCURRENCY)
+    fetch.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE)
+    fetch.add_argument("--no-batch", action="store_true", help="one forecast request per city")
+    fetch.add_argument("--indent", type=int, default=2)
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+    results, errors = fetch_many(args.cities, concurrency=args.concurrency,
+                                 batch=not args.no_batch, chunk_size=args.chunk_size)
+    out = {
+        "units": args.units,
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "results": {city: localize_info(results[city], args.units) for city in args.cities if city in results},
+        "errors": {city: errors[city] for city in args.cities if city in errors},
+    }
+    json.dump(out, sys.stdout, indent=args.indent or None, ensure_ascii=False)
+    sys.stdout.write("\n")
+    flush_log()
+    return 1 if errors else 0
@@ -0,0 +1,285 @@
+# TrayWeatherApp module: common.py
+
+from datetime import datetime
+from pathlib import Path
+import sys, json, os, threading, queue, atexit, time
+
+# ---------- Paths ----------
+# nothing in this module imports Qt, so the fetch engine and CLI can run without a display
+def get_base_path() -> Path:
+    if getattr(sys, 'frozen', False):
+        return Path(sys.executable).parent
+    return Path(__file__).resolve().parent.parent
+
+CONFIG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.json"
+LOG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.log"
+GEOCODE_CACHE_PATH = Path.home() / ".TrayWeatherApp" / "geocode_cache.json"
+FORECAST_CACHE_PATH = Path.home() / ".TrayWeatherApp" / "forecast_cache.json"
+BASE_DIR = get_base_path()
+THEMES_DIR = BASE_DIR / "themes"
+
+DEFAULT_CONFIG = {
+    "cities": ["New York"],
+    "units": "imperial",
+    "window_pos": [100, 100],
+    "window_size": [760, 440],
+    "debug": False,
+    "time_format_24h": False,
+    "theme": "Dark",
+    "batch_fetch": True,
+    "batch_chunk_size": 50,
+    "fetch_concurrency": 4,
+    "max_live_cards": 0,
+    "view_mode": "tabs",
+    "metrics_enabled": False,
+    "metrics_dump_path": "",
+    "metrics_dump_interval_s": 60
+}
+
+def atomic_write_text(path: Path, text: str):
+    # write to a sibling temp file and rename over the target so readers never see a partial file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            try: tmp.unlink()
+            except OSError: pass
+
+# ---------- Config Store ----------
+_MISSING = object()
+
+class ConfigStore(dict):
+    SAVE_DELAY = 0.75
+
+    def __init__(self, path: Path, defaults: dict, delay: float = SAVE_DELAY):
+        super().__init__(json.loads(json.dumps(defaults)))
+        self.path = path
+        self.delay = delay
+        self.dirty_keys = set()
+        self._saved = {}
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def load(self):
+        with self._lock:
+            if self.path.exists():
+                try:
+                    super().update(json.loads(self.path.read_text(encoding="utf-8")))
+                except Exception as e:
+                    log(f"Config load failed: {e}", "ERROR")
+            self._saved = json.loads(json.dumps(self))
+            self.dirty_keys.clear()
+        return self
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            # compare against the last written snapshot so in-place list edits are caught too
+            if self._saved.get(key, object()) != value:
+                self.dirty_keys.add(key)
+                self.schedule_save()
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+            self.dirty_keys.add(key)
+            self.schedule_save()
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    # dict's C implementations of these bypass __setitem__/__delitem__, so route them back through
+    def setdefault(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                self[key] = default
+            return super().__getitem__(key)
+
+    def pop(self, key, default=_MISSING):
+        with self._lock:
+            if key not in self:
+                if default is _MISSING:
+                    raise KeyError(key)
+                return default
+            value = super().__getitem__(key)
+            del self[key]
+            return value
+
+    def popitem(self):
+        with self._lock:
+            if not self:
+                raise KeyError("popitem(): config is empty")
+            key = next(reversed(self))
+            return key, self.pop(key)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self):
+                del self[key]
+
+    def schedule_save(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.dirty_keys:
+                return
+            text = json.dumps(self, indent=2)
+            keys = sorted(self.dirty_keys)
+            self.dirty_keys.clear()
+            self._saved = json.loads(text)
+        try:
+            atomic_write_text(self.path, text)
+            log(f"Config saved (changed: {', '.join(keys)})")
+        except Exception as e:
+            log(f"Config save error: {e}", "ERROR")
+            with self._lock:
+                self.dirty_keys.update(keys)
+
+config_store = ConfigStore(CONFIG_PATH, DEFAULT_CONFIG)
+atexit.register(config_store.flush)
+
+def load_config():
+    return config_store.load()
+
+def save_config(cfg: dict):
+    if cfg is not config_store:
+        config_store.update(cfg)
+    config_store.schedule_save()
+
+# ---------- Logging ----------
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+class LogWriter:
+    BATCH_LIMIT = 256
+
+    def __init__(self, path: Path, max_bytes: int = LOG_MAX_BYTES, backups: int = LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.debug_enabled = None
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._file = None
+        self._failing = False
+
+    def set_debug(self, enabled: bool):
+        self.debug_enabled = bool(enabled)
+
+    def _load_debug_flag(self):
+        # read the config once; afterwards the flag is pushed in through set_debug()
+        enabled = True
+        try:
+            if CONFIG_PATH.exists():
+                enabled = json.loads(CONFIG_PATH.read_text(encoding="utf-8")).get("debug", True)
+        except Exception:
+            pass
+        self.debug_enabled = bool(enabled)
+
+    def write(self, msg, level: str):
+        if self.debug_enabled is None:
+            self._load_debug_flag()
+        if level == "DEBUG" and not self.debug_enabled:
+            return
+        self._queue.put((time.time(), level, msg))
+        if self._thread is None:
+            self._start()
+
+    def flush(self, timeout: float = 1.0):
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_LIMIT:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines, waiters = [], []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    ts, level, msg = item
+                    lines.append(f"[{datetime.fromtimestamp(ts):%Y-%m-%d %H:%M:%S}] [{level}] {msg}\n")
+            if lines:
+                self._write_lines(lines)
+            for w in waiters:
+                w.set()
+
+    def _write_lines(self, lines):
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write("".join(lines))
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+            self._failing = False
+        except Exception as e:
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+                self._file = None
+            # the log cannot report its own failure; say it on stderr once per failing streak
+            if not self._failing:
+                self._failing = True
+                print(f"TrayWeatherApp: cannot write log {self.path}: {e} ({len(lines)} lines dropped)", file=sys.stderr)
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+_log_writer = LogWriter(LOG_PATH)
+atexit.register(_log_writer.flush)
+
+def log(msg, level="DEBUG"):
+    try:
+        _log_writer.write(msg, level)
+    except Exception:
+        pass
+
+def set_log_debug(enabled: bool):
+    _log_writer.set_debug(enabled)
+
+def flush_log(timeout: float = 1.0):
+    _log_writer.flush(timeout)
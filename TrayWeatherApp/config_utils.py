@@ -1,116 +1,120 @@
 # TrayWeatherApp module: config_utils.py
 
-from datetime import datetime
-from datetime import datetime, timezone, timedelta
-from pathlib import Path
-from pathlib import Path
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QObject
-from PyQt6.QtGui import QIcon, QPixmap, QFont, QPainter, QLinearGradient, QColor
-from PyQt6.QtWidgets import (    
-    QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QSystemTrayIcon, QMenu, QDialog, QFormLayout, QPushButton,
-    QComboBox, QInputDialog, QCheckBox, QSpacerItem, QSizePolicy,
-    QGraphicsDropShadowEffect, QTabBar, QToolButton
+from collections import OrderedDict
+from functools import lru_cache
+from PyQt6.QtCore import Qt, QRect, QRectF
+from PyQt6.QtGui import QIcon, QPixmap, QFont, QPainter, QImage, QColor
+from PyQt6.QtWidgets import QApplication, QGraphicsScene, QGraphicsPixmapItem, QGraphicsDropShadowEffect
+import platform
+
+from TrayWeatherApp.common import (
+    get_base_path, CONFIG_PATH, LOG_PATH, GEOCODE_CACHE_PATH, FORECAST_CACHE_PATH, BASE_DIR, THEMES_DIR,
+    DEFAULT_CONFIG, atomic_write_text, ConfigStore, config_store, load_config, save_config,
+    LogWriter, log, set_log_debug, flush_log
 )
-import json
-import sys, json, requests, traceback, platform, ctypes, zipfile, io, re
-
-# ---------- Paths ----------
-def get_base_path() -> Path:
-    if getattr(sys, 'frozen', False):
-        return Path(sys.executable).parent
-    return Path(__file__).resolve().parent.parent
-
-CONFIG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.json"
-LOG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.log"
-BASE_DIR = get_base_path()
-THEMES_DIR = BASE_DIR / "themes"
-CONFIG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.json"
-LOG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.log"
-
-CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-THEMES_DIR.mkdir(parents=True, exist_ok=True)
-
-CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-THEMES_DIR.mkdir(parents=True, exist_ok=True)
-
-DEFAULT_CONFIG = {
-    "cities": ["New York"],
-    "units": "imperial",
-    "window_pos": [100, 100],
-    "window_size": [760, 440],
-    "debug": False,
-    "time_format_24h": False,
-    "theme": "Dark" 
-}
-
-
-CONFIG_PATH = Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.json"
-CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-def load_config():
-    if CONFIG_PATH.exists():
-        try:
-            return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return {
-        "cities": ["New York"],
-        "units": "imperial",
-        "window_pos": [100, 100],
-        "window_size": [760, 440],
-        "debug": False,
-        "time_format_24h": False,
-        "theme": "Dark"
-    }
-
-def save_config(cfg: dict):
-    try:
-        CONFIG_PATH.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
-    except Exception as e:
-        with open(Path.home() / ".TrayWeatherApp" / "pyqt_tray_weather.log", "a", encoding="utf-8") as f:
-            f.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] [ERROR] Failed to save config: {e}\n")
-
-# ---------- Logging ----------
-def log(msg, level="DEBUG"):
-    try:
-        debug_enabled = True
-        if CONFIG_PATH.exists():
-            cfg = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-            debug_enabled = cfg.get("debug", True)
-        if not debug_enabled and level == "DEBUG":
-            return
-        line = f"[{datetime.now():%Y-%m-%d %H:%M:%S}] [{level}] {msg}"
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass
 
 # ---------- Icons ----------
-def create_tray_icon(emoji: str = "☀️") -> QIcon:
-    pix = QPixmap(64, 64)
+ICON_CACHE_SIZE = 64
+_icon_cache = OrderedDict()
+
+def glyph_icon(glyph: str, size: int = 64, dpr: float | None = None) -> QIcon:
+    if dpr is None:
+        app = QApplication.instance()
+        dpr = app.devicePixelRatio() if app else 1.0
+    # the icon is plain glyph art, so themes share entries instead of filling the cache with copies
+    key = (glyph, size, round(dpr, 2))
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        _icon_cache.move_to_end(key)
+        return icon
+    pix = QPixmap(round(size * dpr), round(size * dpr))
+    pix.setDevicePixelRatio(dpr)
     pix.fill(Qt.GlobalColor.transparent)
     p = QPainter(pix)
     p.setRenderHint(QPainter.RenderHint.Antialiasing)
-    p.setFont(QFont("Segoe UI Emoji", 48))
-    p.drawText(pix.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+    p.setFont(QFont("Segoe UI Emoji", size * 3 // 4))
+    p.drawText(QRect(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, glyph)
+    p.end()
+    icon = QIcon(pix)
+    _icon_cache[key] = icon
+    while len(_icon_cache) > ICON_CACHE_SIZE:
+        _icon_cache.popitem(last=False)
+    return icon
+
+def prewarm_icons(glyphs, size: int = 64):
+    for glyph in glyphs:
+        glyph_icon(glyph, size)
+
+# ---------- Glow Pixmaps ----------
+GLOW_CACHE_SIZE = 48
+GLOW_BLUR = 30
+_glow_cache = OrderedDict()
+
+def glow_pixmap(glyph: str, size: int, glow: QColor, color: QColor | None = None, dpr: float | None = None) -> QPixmap:
+    # the drop shadow is rendered once per key; labels then just blit the result
+    if dpr is None:
+        app = QApplication.instance()
+        dpr = app.devicePixelRatio() if app else 1.0
+    # color only matters for monochrome fallback glyphs; color emoji ignore the pen
+    key = (glyph, size, glow.rgba(), color.rgba() if color is not None else None, round(dpr, 2))
+    pix = _glow_cache.get(key)
+    if pix is not None:
+        _glow_cache.move_to_end(key)
+        return pix
+
+    pad = GLOW_BLUR // 2 + 2
+    side = round((size + 2 * pad) * dpr)
+    base = QPixmap(side, side)
+    base.fill(Qt.GlobalColor.transparent)
+    p = QPainter(base)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    font = QFont("Segoe UI Emoji")
+    font.setPixelSize(max(1, round(size * dpr * 0.8)))
+    p.setFont(font)
+    if color is not None:
+        p.setPen(color)
+    p.drawText(QRect(0, 0, side, side), Qt.AlignmentFlag.AlignCenter, glyph)
     p.end()
-    return QIcon(pix)
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(base)
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(GLOW_BLUR * dpr)
+    effect.setColor(glow)
+    effect.setOffset(0, 0)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    img = QImage(side, side, QImage.Format.Format_ARGB32_Premultiplied)
+    img.fill(Qt.GlobalColor.transparent)
+    p = QPainter(img)
+    scene.render(p, QRectF(0, 0, side, side), QRectF(0, 0, side, side))
+    p.end()
+
+    pix = QPixmap.fromImage(img)
+    pix.setDevicePixelRatio(dpr)
+    _glow_cache[key] = pix
+    while len(_glow_cache) > GLOW_CACHE_SIZE:
+        _glow_cache.popitem(last=False)
+    return pix
+
+def create_tray_icon(emoji: str = "☀️") -> QIcon:
+    return glyph_icon(emoji)
 
 def set_sun_icon(window):
-    pix = QPixmap(64, 64)
-    pix.fill(Qt.GlobalColor.transparent)
-    painter = QPainter(pix)
-    painter.setFont(QFont("Segoe UI Emoji", 48))
-    painter.drawText(pix.rect(), Qt.AlignmentFlag.AlignCenter, "☀️")
-    painter.end()
-    window.setWindowIcon(QIcon(pix))
+    window.setWindowIcon(glyph_icon("☀️"))
+
+# ---------- Fonts ----------
+@lru_cache(maxsize=128)
+def cached_font(family: str, size: int, weight: QFont.Weight | None = None) -> QFont:
+    # callers must not mutate the returned font; setFont() takes its own copy
+    return QFont(family, size) if weight is None else QFont(family, size, weight)
 
 # ---------- Blur ----------
 def enable_windows_acrylic(widget):
     try:
         if platform.system() != "Windows":
             return
+        import ctypes
         hwnd = widget.winId().__int__()
 
         class ACCENTPOLICY(ctypes.Structure):
@@ -0,0 +1,120 @@
+# TrayWeatherApp module: diagnostics.py
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from TrayWeatherApp.config_utils import set_sun_icon, log
+from TrayWeatherApp.metrics import metrics
+from TrayWeatherApp.cache import geocode_cache
+from TrayWeatherApp.ratelimit import breaker_states
+from TrayWeatherApp.timeseries import forecast_store
+
+SPAN_COLUMNS = ("Span", "Count", "Mean ms", "p50 ms", "p95 ms", "p99 ms", "Max ms")
+SPAN_KEYS = ("count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+# ---------- Diagnostics Window ----------
+class DiagnosticsWindow(QDialog):
+    REFRESH_MS = 1000
+
+    def __init__(self, app_ref):
+        super().__init__()
+        self.app_ref = app_ref
+        self.setWindowTitle("Diagnostics")
+        set_sun_icon(self)
+        self.resize(620, 460)
+
+        self.enable_cb = QCheckBox("Collect timings and counters")
+        self.enable_cb.setChecked(metrics.enabled)
+        self.enable_cb.toggled.connect(self.on_enable_toggled)
+        self.status_lbl = QLabel()
+        self.status_lbl.setWordWrap(True)
+
+        self.spans = self.make_table(SPAN_COLUMNS)
+        self.counters = self.make_table(("Counter", "Value"))
+
+        reset, dump, close = QPushButton("Reset"), QPushButton("Dump now"), QPushButton("Close")
+        reset.clicked.connect(self.on_reset)
+        dump.clicked.connect(self.app_ref.dump_metrics)
+        dump.setEnabled(bool(self.app_ref.config.get("metrics_dump_path")))
+        dump.setToolTip(self.app_ref.config.get("metrics_dump_path") or "Set metrics_dump_path in the config file")
+        close.clicked.connect(self.close)
+        btns = QHBoxLayout()
+        btns.addWidget(reset)
+        btns.addWidget(dump)
+        btns.addStretch(1)
+        btns.addWidget(close)
+
+        lay = QVBoxLayout()
+        lay.addWidget(self.enable_cb)
+        lay.addWidget(self.status_lbl)
+        lay.addWidget(self.spans, 3)
+        lay.addWidget(self.counters, 2)
+        lay.addLayout(btns)
+        self.setLayout(lay)
+        self.setStyleSheet(self.app_ref.theme.stylesheet("dialog"))
+
+        # polls only while shown, so a closed panel costs nothing
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.REFRESH_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    @staticmethod
+    def make_table(columns) -> QTableWidget:
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    @staticmethod
+    def fill(table: QTableWidget, rows):
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                item = table.item(r, c)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if c:
+                        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    table.setItem(r, c, item)
+                item.setText(str(value))
+
+    def refresh(self):
+        snap = metrics.snapshot()
+        self.fill(self.spans, [(name, *(s[k] for k in SPAN_KEYS)) for name, s in snap["spans"].items()])
+        self.fill(self.counters, list(snap["counters"].items()))
+
+        fetcher = self.app_ref.fetcher
+        geo = geocode_cache.stats()
+        breakers = ", ".join(f"{h}: {s}" for h, s in breaker_states().items()) or "no requests yet"
+        state = "collecting" if snap["enabled"] else "paused"
+        self.status_lbl.setText(
+            f"Metrics {state} for {snap['uptime_s']:.0f} s · pending fetch jobs: {len(fetcher.pending) if fetcher else 0}"
+            f" · follow-ups queued: {len(fetcher.followups) if fetcher else 0}"
+            f" · series stored: {len(forecast_store.cities())}\n"
+            f"Geocode cache: {geo['entries']} entries, {geo['hits']} hits / {geo['misses']} misses · circuits: {breakers}"
+        )
+
+    def on_enable_toggled(self, checked: bool):
+        self.app_ref.set_metrics_enabled(checked)
+        self.refresh()
+
+    def on_reset(self):
+        metrics.reset()
+        log("Diagnostics counters reset")
+        self.refresh()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self.refresh()
+        self.timer.start()
+
+    def hideEvent(self, e):
+        self.timer.stop()
+        super().hideEvent(e)
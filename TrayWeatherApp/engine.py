@@ -0,0 +1,296 @@
+# TrayWeatherApp module: engine.py
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from TrayWeatherApp.common import log
+from TrayWeatherApp.cache import geocode_cache
+from TrayWeatherApp.timeseries import forecast_store, CitySeries, HOURLY_FIELDS, DAILY_FIELDS, FORECAST_DAYS
+from TrayWeatherApp.ratelimit import guarded_get, stopping
+from TrayWeatherApp.metrics import metrics, span, incr
+from requests.adapters import HTTPAdapter
+import requests, threading, time
+
+GEO_URL = "https://geocoding-api.open-meteo.com/v1/search"
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+BATCH_CHUNK_SIZE = 50
+FETCH_CONCURRENCY = 4
+
+class FetchError(Exception):
+    pass
+
+# ---------- HTTP sessions ----------
+_session_local = threading.local()
+
+def http_session() -> requests.Session:
+    # one keep-alive session per pool thread; the threads are long-lived so TLS setup is paid once
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session_local.session = session
+    return session
+
+def api_get(url: str, params: dict, timeout: float = 10, kind: str = "forecast", cost: int = 1) -> requests.Response:
+    # every Open-Meteo call shares one token bucket and a per-host circuit breaker; cost is the
+    # number of locations, which is what Open-Meteo bills
+    with span(f"http.{kind}"):
+        r = guarded_get(http_session(), url, params=params, timeout=timeout, cost=cost)
+    if metrics.enabled:
+        incr(f"requests.{kind}")
+        incr(f"bytes.{kind}", len(r.content))
+        if r.status_code != 200:
+            incr(f"http_errors.{kind}")
+    return r
+
+def decode_json(r: requests.Response):
+    with span("json_decode"):
+        return r.json()
+
+# ---------- Request helpers ----------
+def resolve_location(city: str) -> dict:
+    loc = geocode_cache.get(city)
+    if loc is not None:
+        incr("geocode_cache.hits")
+        return loc
+    incr("geocode_cache.misses")
+    with span("geocode"):
+        rg = api_get(GEO_URL, {"name": city, "count": 1}, kind="geocode")
+        if rg.status_code != 200:
+            raise FetchError(f"Geocode error {rg.status_code}")
+        geo = decode_json(rg).get("results", [])
+    if not geo:
+        raise FetchError(f"City not found: {city}")
+    loc = geo[0]
+    geocode_cache.put(city, loc)
+    return loc
+
+def forecast_params(locs: list[dict]) -> dict:
+    # always °C and m/s; the display units are applied at render time (see units.py)
+    return {
+        "latitude": ",".join(str(loc["latitude"]) for loc in locs),
+        "longitude": ",".join(str(loc["longitude"]) for loc in locs),
+        "current": [
+            "temperature_2m", "apparent_temperature",
+            "relative_humidity_2m", "wind_speed_10m", "weather_code"
+        ],
+        "hourly": list(HOURLY_FIELDS),
+        "daily": list(DAILY_FIELDS),
+        "forecast_days": FORECAST_DAYS,
+        "timeformat": "unixtime",
+        "timezone": "auto",
+        "temperature_unit": "celsius",
+        "wind_speed_unit": "ms",
+    }
+
+def build_result(city: str, loc: dict, d: dict) -> dict:
+    # the full hourly/daily series go to the array store, the card only needs the summary dict
+    try:
+        forecast_store.put(city, CitySeries.from_payload(d))
+    except (TypeError, ValueError) as e:
+        log(f"Ignoring malformed forecast series for {city}: {e}", "ERROR")
+    return build_info(city, loc, d)
+
+def build_info(city: str, loc: dict, d: dict) -> dict:
+    city_name = loc.get("name", city)
+    country_code = loc.get("country_code") or loc.get("country", "")
+    display_name = f"{city_name}, {country_code}".strip().strip(",")
+    cur, daily = d.get("current", {}), d.get("daily", {})
+
+    tz_offset = d.get("utc_offset_seconds", 0)
+    local_time = datetime.utcnow() + timedelta(seconds=tz_offset)
+    hour = local_time.hour
+    is_night = hour < 6 or hour >= 18
+
+    desc, emoji = map_weather_code(cur.get("weather_code"), is_night=is_night)
+
+    return {
+        "city": display_name,
+        "temp": cur.get("temperature_2m"),
+        "feels_like": cur.get("apparent_temperature"),
+        "humidity": cur.get("relative_humidity_2m"),
+        "wind_speed": cur.get("wind_speed_10m"),
+        "desc": desc,
+        "icon": emoji,
+        "timezone": tz_offset,
+        "high": (daily.get("temperature_2m_max") or [None])[0],
+        "low": (daily.get("temperature_2m_min") or [None])[0],
+        "fetched_at": time.time(),
+    }
+
+WEATHER_CODES = {
+    0: ("Clear sky", "☀️", "🌙"),
+    1: ("Mainly clear", "🌤️", "🌙"),
+    2: ("Partly cloudy", "⛅", "☁️"),
+    3: ("Overcast", "☁️", "☁️"),
+    45: ("Fog", "🌫️", "🌫️"),
+    48: ("Rime fog", "🌫️", "🌫️"),
+    51: ("Light drizzle", "🌦️", "🌦️"),
+    53: ("Drizzle", "🌧️", "🌧️"),
+    55: ("Heavy drizzle", "🌧️", "🌧️"),
+    61: ("Light rain", "🌦️", "🌦️"),
+    63: ("Rain", "🌧️", "🌧️"),
+    65: ("Heavy rain", "🌧️", "🌧️"),
+    71: ("Light snow", "🌨️", "🌨️"),
+    73: ("Snow", "❄️", "❄️"),
+    75: ("Heavy snow", "❄️", "❄️"),
+    95: ("Thunderstorm", "⛈️", "⛈️"),
+}
+UNKNOWN_WEATHER = ("Unknown", "🌍")
+
+def map_weather_code(code: int | None, is_night=False):
+    entry = WEATHER_CODES.get(code)
+    if entry is None:
+        return UNKNOWN_WEATHER
+    desc, day, night = entry
+    return (desc, night if is_night else day)
+
+def weather_icons() -> list[str]:
+    icons = {UNKNOWN_WEATHER[1]}
+    for _, day, night in WEATHER_CODES.values():
+        icons.update((day, night))
+    return sorted(icons)
+
+# ---------- In-flight coalescing ----------
+CITY_TIMEOUT_S = 10
+BATCH_TIMEOUT_S = 20
+# send_owned always settles its flights, so waiters only poll to notice shutdown
+FLIGHT_POLL_S = 0.5
+
+class Flight:
+    __slots__ = ("done", "payload", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.payload = None
+        self.error = None
+
+class InFlight:
+    # forecast requests on the wire, keyed by resolved coordinates and request params; later
+    # requests for the same key wait for that answer instead of sending their own
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    @staticmethod
+    def key(loc: dict) -> tuple:
+        params = forecast_params([loc])
+        coords = (round(float(params.pop("latitude")), 4), round(float(params.pop("longitude")), 4))
+        return coords + tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def claim(self, key: tuple) -> tuple[Flight, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = Flight()
+            return flight, True
+
+    def settle(self, key: tuple, flight: Flight, payload=None, error: str | None = None):
+        flight.payload, flight.error = payload, error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+in_flight = InFlight()
+
+# ---------- Fetching ----------
+def fetch_city(city: str) -> dict:
+    out = {}
+    fetch_batch([city], lambda _, info: out.update(info=info), lambda _, msg: out.update(error=msg))
+    if "info" not in out:
+        raise FetchError(out.get("error", f"No result for {city}"))
+    return out["info"]
+
+def fetch_batch(cities: list[str], on_result, on_error):
+    # resolve everything before claiming, so a slow geocode never holds a claimed flight back
+    resolved = []
+    for city in cities:
+        try:
+            loc = resolve_location(city)
+            resolved.append((city, loc, in_flight.key(loc)))
+        except Exception as e:
+            on_error(city, str(e))
+    # new geocodes are written once per job, off the GUI thread
+    geocode_cache.flush()
+    owned, joined = [], []
+    for city, loc, key in resolved:
+        flight, is_owner = in_flight.claim(key)
+        (owned if is_owner else joined).append((city, loc, key, flight))
+    if owned:
+        send_owned(owned, on_result, on_error)
+    for city, loc, _, flight in joined:
+        # same place under another name, or already requested by a concurrent job
+        incr("coalesced.forecast")
+        while not flight.done.wait(FLIGHT_POLL_S) and not stopping():
+            pass
+        if not flight.done.is_set():
+            on_error(city, "Shut down while waiting for a shared forecast request")
+        elif flight.error is not None:
+            on_error(city, flight.error)
+        else:
+            try:
+                on_result(city, build_result(city, loc, flight.payload))
+            except Exception as e:
+                on_error(city, str(e))
+
+def send_owned(owned: list[tuple], on_result, on_error):
+    try:
+        params = forecast_params([loc for _, loc, _, _ in owned])
+        r = api_get(FORECAST_URL, params, timeout=CITY_TIMEOUT_S if len(owned) == 1 else BATCH_TIMEOUT_S,
+                    cost=len(owned))
+        if r.status_code != 200:
+            raise FetchError(f"Weather API error {r.status_code}")
+        payload = decode_json(r)
+        # a single location comes back as an object, several as a list in request order
+        results = payload if isinstance(payload, list) else [payload]
+        if len(results) != len(owned):
+            raise FetchError(f"Batch returned {len(results)} results for {len(owned)} cities")
+    except Exception as e:
+        if len(owned) > 1:
+            log(f"Batch forecast failed for {len(owned)} cities: {e}", "ERROR")
+        # waiters get the same error as the owner
+        for _, _, key, flight in owned:
+            in_flight.settle(key, flight, error=str(e))
+        for city, *_ in owned:
+            on_error(city, str(e))
+        return
+    if len(owned) > 1:
+        log(f"Batch forecast fetched {len(owned)} cities in one request")
+    for (city, loc, key, flight), d in zip(owned, results):
+        in_flight.settle(key, flight, payload=d)
+        try:
+            on_result(city, build_result(city, loc, d))
+        except Exception as e:
+            on_error(city, str(e))
+
+def fetch_many(cities: list[str], concurrency: int = FETCH_CONCURRENCY,
+               batch: bool = True, chunk_size: int = BATCH_CHUNK_SIZE) -> tuple[dict, dict]:
+    # blocking counterpart of FetchExecutor for scripts; returns ({city: info}, {city: error})
+    results, errors = {}, {}
+    def on_result(city, info):
+        results[city] = info
+    def on_error(city, msg):
+        errors[city] = msg
+    def city_job(city):
+        try:
+            on_result(city, fetch_city(city))
+        except Exception as e:
+            on_error(city, str(e))
+
+    chunk_size = max(1, int(chunk_size))
+    with ThreadPoolExecutor(max_workers=max(1, int(concurrency)), thread_name_prefix="weather-fetch") as pool:
+        if batch:
+            jobs = [pool.submit(fetch_batch, cities[i:i + chunk_size], on_result, on_error)
+                    for i in range(0, len(cities), chunk_size)]
+        else:
+            jobs = [pool.submit(city_job, city) for city in cities]
+        for job in jobs:
+            job.result()
+    return results, errors
@@ -0,0 +1,156 @@
+# TrayWeatherApp module: metrics.py
+
+from collections import deque
+from functools import wraps
+from pathlib import Path
+from TrayWeatherApp.common import atomic_write_text
+import json, re, threading, time
+
+WINDOW = 1024
+
+# ---------- Histogram ----------
+class Histogram:
+    __slots__ = ("samples", "count", "total", "peak")
+
+    def __init__(self, window: int = WINDOW):
+        # percentiles come from the most recent samples, count/total cover the whole session
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.peak = 0.0
+
+    def add(self, value: float):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        if value > self.peak:
+            self.peak = value
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        def pct(q):
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000 if ordered else 0.0
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(pct(0.50), 3),
+            "p95_ms": round(pct(0.95), 3),
+            "p99_ms": round(pct(0.99), 3),
+            "max_ms": round(self.peak * 1000, 3),
+        }
+
+# ---------- Registry ----------
+class Metrics:
+    def __init__(self):
+        self.enabled = False
+        self.started = time.time()
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = bool(enabled)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.time()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            hist.add(seconds)
+
+    def incr(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "since": self.started,
+                "uptime_s": round(time.time() - self.started, 1),
+                "spans": {name: h.summary() for name, h in sorted(self.histograms.items())},
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def prometheus_text(self) -> str:
+        snap = self.snapshot()
+        lines = []
+        for name, s in snap["spans"].items():
+            metric = "trayweather_" + re.sub(r"[^a-zA-Z0-9_]", "_", name) + "_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for q, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                lines.append(f'{metric}{{quantile="{q}"}} {s[key] / 1000:.6f}')
+            lines.append(f"{metric}_sum {s['total_ms'] / 1000:.6f}")
+            lines.append(f"{metric}_count {s['count']}")
+        for name, value in snap["counters"].items():
+            metric = "trayweather_" + re.sub(r"[^a-zA-Z0-9_]", "_", name) + "_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Path):
+        # .prom/.txt files get the Prometheus text format, anything else JSON
+        path = Path(path).expanduser()
+        if path.suffix in (".prom", ".txt"):
+            text = self.prometheus_text()
+        else:
+            text = json.dumps(self.snapshot(), indent=2)
+        atomic_write_text(path, text)
+
+metrics = Metrics()
+
+# ---------- Spans ----------
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+def span(name: str):
+    # disabled collection costs one attribute check and returns a shared no-op object
+    return _Span(name) if metrics.enabled else _NULL_SPAN
+
+def timed(name: str):
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+def incr(name: str, amount: int = 1):
+    metrics.incr(name, amount)
@@ -0,0 +1,153 @@
+# TrayWeatherApp module: overview.py
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QSize
+from PyQt6.QtGui import QColor, QFont, QPainter
+from PyQt6.QtWidgets import QListView, QStyle, QStyledItemDelegate, QAbstractItemView
+from TrayWeatherApp.config_utils import cached_font
+from TrayWeatherApp import units
+
+INFO_ROLE = Qt.ItemDataRole.UserRole + 1
+CITY_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# ---------- Overview Model ----------
+class CityTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cities = []
+        self.rows = {}
+        self.infos = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.cities)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        city = self.cities[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.infos.get(city, {}).get("city", city)
+        if role == INFO_ROLE:
+            return self.infos.get(city, {})
+        if role == CITY_ROLE:
+            return city
+        return None
+
+    def set_cities(self, cities: list[str], infos: dict | None = None):
+        self.beginResetModel()
+        self.cities = list(cities)
+        self.rows = {city: i for i, city in enumerate(self.cities)}
+        if infos is not None:
+            self.infos = dict(infos)
+        self.endResetModel()
+
+    def update_city(self, city: str, info: dict):
+        self.infos[city] = info
+        row = self.rows.get(city)
+        if row is not None:
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx)
+
+# ---------- Overview Delegate ----------
+class CityRowDelegate(QStyledItemDelegate):
+    ROW_HEIGHT = 44
+
+    def __init__(self, app_ref, parent=None):
+        super().__init__(parent)
+        self.app_ref = app_ref
+        self.apply_theme()
+
+    def apply_theme(self):
+        t = self.app_ref.theme
+        self.colors = {
+            "text": t.color("text_primary", "#E6E8EE"),
+            "muted": t.color("text_muted", "#9EA3B8"),
+            "temp": t.color("temp_color", "#FFD18A"),
+            "high": t.color("high_color", "#FFB347"),
+            "low": t.color("low_color", "#7DD3FC"),
+            "row": t.color("glass_card_color", "rgba(20,22,30,150)"),
+            "selected": t.color("tab_bg_selected", "rgba(255,255,255,45)"),
+        }
+        self.fonts = {
+            "icon": cached_font("Segoe UI Emoji", 18),
+            "city": cached_font("Segoe UI", 11, QFont.Weight.Bold),
+            "desc": cached_font("Segoe UI", 9),
+            "temp": cached_font("Segoe UI", 14, QFont.Weight.DemiBold),
+            "range": cached_font("Segoe UI", 10),
+        }
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, p: QPainter, option, index):
+        info = index.data(INFO_ROLE) or {}
+        r = option.rect.adjusted(2, 2, -2, -2)
+        p.save()
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        p.setBrush(self.colors["selected"] if selected else self.colors["row"])
+        p.drawRoundedRect(r, 8, 8)
+
+        x = r.left() + 10
+        p.setFont(self.fonts["icon"])
+        p.setPen(self.colors["text"])
+        p.drawText(QRect(x, r.top(), 32, r.height()), Qt.AlignmentFlag.AlignCenter, info.get("icon", "🌍"))
+        x += 42
+
+        right_w = 210
+        text_w = max(40, r.right() - right_w - x)
+        half = r.height() // 2
+        p.setFont(self.fonts["city"])
+        p.drawText(QRect(x, r.top() + 2, text_w, half), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                   index.data(Qt.ItemDataRole.DisplayRole))
+        p.setFont(self.fonts["desc"])
+        p.setPen(self.colors["muted"])
+        p.drawText(QRect(x, r.top() + half - 2, text_w, half), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                   str(info.get("desc", "-")).capitalize())
+
+        display = self.app_ref.units
+        unit = units.labels(display)[0]
+        t = units.temp(info.get("temp"), display)
+        p.setFont(self.fonts["temp"])
+        p.setPen(self.colors["temp"])
+        temp_rect = QRect(r.right() - right_w, r.top(), 90, r.height())
+        p.drawText(temp_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                   f"{t:.1f}°{unit}" if t is not None else "-°")
+
+        hi, lo = units.temp(info.get("high"), display), units.temp(info.get("low"), display)
+        p.setFont(self.fonts["range"])
+        range_rect = QRect(r.right() - 110, r.top(), 100, half)
+        p.setPen(self.colors["high"])
+        p.drawText(range_rect.translated(0, 2), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                   f"↑ {hi:.0f}°" if hi is not None else "↑ -")
+        p.setPen(self.colors["low"])
+        p.drawText(range_rect.translated(0, half - 2), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                   f"↓ {lo:.0f}°" if lo is not None else "↓ -")
+        p.restore()
+
+# ---------- Overview View ----------
+class CityOverview(QListView):
+    def __init__(self, app_ref, parent=None):
+        super().__init__(parent)
+        self.model_ = CityTableModel(self)
+        self.delegate = CityRowDelegate(app_ref, self)
+        self.setModel(self.model_)
+        self.setItemDelegate(self.delegate)
+        # fixed row heights let the view skip measuring rows that are not on screen
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(100)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setStyleSheet("QListView { background: transparent; border: none; }")
+        self.viewport().setAutoFillBackground(False)
+
+    def retheme(self):
+        self.delegate.apply_theme()
+        self.viewport().update()
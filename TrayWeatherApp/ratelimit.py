@@ -0,0 +1,185 @@
+# TrayWeatherApp module: ratelimit.py
+
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import random, threading, time
+
+# Open-Meteo free tier: 600 calls/minute, 5000/hour, and each location in a request is billed as a call;
+# stay under the hourly budget and never exceed the per-minute one in a burst
+RATE_PER_SECOND = 5000 / 3600
+BURST = 600
+MAX_RETRIES = 3
+MAX_RETRY_WAIT_S = 30
+# a hostile or broken Retry-After never parks the client for longer than this
+MAX_PAUSE_S = 5 * 60
+# a request that cannot get a token this soon fails and is left to the refresh scheduler's backoff
+ACQUIRE_TIMEOUT_S = MAX_RETRY_WAIT_S
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_S = 60
+# a half-open probe that never reports back (thread killed, stuck socket) frees its slot after this
+PROBE_TIMEOUT_S = 120
+
+class CircuitOpenError(Exception):
+    pass
+
+class RateLimitError(Exception):
+    pass
+
+# set on shutdown so threads sleeping in the limiter or between retries wake up and give up
+_stopping = threading.Event()
+
+def stop_waiting():
+    _stopping.set()
+
+def stopping() -> bool:
+    return _stopping.is_set()
+
+# ---------- Token Bucket ----------
+class TokenBucket:
+    def __init__(self, rate: float = RATE_PER_SECOND, capacity: float = BURST, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, timeout: float | None = None, cost: float = 1) -> bool:
+        # a request bigger than the bucket waits for a full bucket and leaves the rest as debt
+        need = min(cost, self.capacity)
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= need:
+                    self.tokens -= cost
+                    return True
+                wait = max(self.blocked_until - now, (need - self.tokens) / self.rate)
+            if deadline is not None and self.clock() + wait > deadline:
+                return False
+            if _stopping.wait(wait):
+                return False
+
+    def pause(self, seconds: float):
+        # a 429 applies to the whole client, not just the request that saw it
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, self.clock() + min(seconds, MAX_PAUSE_S))
+
+# ---------- Circuit Breaker ----------
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, reset_after: float = BREAKER_RESET_S, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = self.clock()
+            if self.state == self.OPEN and now - self.opened_at >= self.reset_after:
+                self.state = self.HALF_OPEN
+                self.probing = False
+            if self.state == self.HALF_OPEN and self.probing and now - self.probe_started >= PROBE_TIMEOUT_S:
+                self.probing = False
+            if self.state == self.HALF_OPEN and not self.probing:
+                # exactly one probe request is let through while half-open
+                self.probing = True
+                self.probe_started = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+                self.probing = False
+
+# ---------- Request policy ----------
+limiter = TokenBucket()
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def breaker_for(url: str) -> CircuitBreaker:
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
+
+def breaker_states() -> dict:
+    with _breakers_lock:
+        return {host: breaker.state for host, breaker in _breakers.items()}
+
+def retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+def backoff_seconds(attempt: int) -> float:
+    return min(MAX_RETRY_WAIT_S, 2 ** attempt) * (0.5 + random.random() / 2)
+
+def guarded_get(session, url: str, params=None, timeout: float = 10, retries: int = MAX_RETRIES, cost: int = 1):
+    breaker = breaker_for(url)
+    for attempt in range(retries + 1):
+        # take the token first so a timeout here never strands a half-open probe slot
+        if not limiter.acquire(timeout=ACQUIRE_TIMEOUT_S, cost=cost):
+            raise RateLimitError("Request budget exhausted, try again later")
+        if not breaker.allow():
+            raise CircuitOpenError(f"{urlsplit(url).netloc} is unavailable, pausing requests")
+        try:
+            r = session.get(url, params=params, timeout=timeout)
+        except Exception:
+            breaker.record_failure()
+            if attempt == retries or _stopping.wait(backoff_seconds(attempt)):
+                raise
+            continue
+        if r.status_code == 429 or r.status_code >= 500:
+            wait = retry_after_seconds(r.headers.get("Retry-After"))
+            if r.status_code == 429:
+                # the host answered, so the circuit is fine; pacing is the token bucket's job
+                breaker.record_success()
+                limiter.pause(wait if wait is not None else backoff_seconds(attempt))
+            else:
+                breaker.record_failure()
+            if attempt == retries or (wait is not None and wait > MAX_RETRY_WAIT_S):
+                return r
+            if _stopping.wait(wait if wait is not None else backoff_seconds(attempt)):
+                return r
+            continue
+        breaker.record_success()
+        return r
@@ -0,0 +1,80 @@
+# TrayWeatherApp module: scheduler.py
+
+import math, random, time, zlib
+
+# Open-Meteo refreshes current conditions every 15 minutes and publishes them a little later
+MODEL_CADENCE_S = 15 * 60
+PUBLISH_DELAY_S = 3 * 60
+RETRY_BASE_S = 60
+MAX_BACKOFF_S = 2 * 3600
+IN_FLIGHT_TIMEOUT_S = 2 * 60
+JITTER_S = 30
+
+# ---------- Refresh Scheduler ----------
+class RefreshScheduler:
+    def __init__(self, interval_s: float, cadence_s: float = MODEL_CADENCE_S,
+                 publish_delay_s: float = PUBLISH_DELAY_S, clock=time.time, rng=random.random):
+        self.cadence = cadence_s
+        # never poll more often than the model produces new data
+        self.interval = max(cadence_s, math.ceil(interval_s / cadence_s) * cadence_s)
+        self.publish_delay = publish_delay_s
+        self.clock = clock
+        self.rng = rng
+        self.due = {}
+        self.failures = {}
+
+    def phase(self, city: str) -> float:
+        # stable per-city offset inside the slot so refreshes are spread instead of bursting together
+        spread = max(0.0, self.cadence - self.publish_delay - 60)
+        return (zlib.crc32(city.encode("utf-8")) % 10_000) / 10_000 * spread
+
+    def jitter(self) -> float:
+        return (self.rng() * 2 - 1) * JITTER_S
+
+    def sync(self, cities: list[str]):
+        now = self.clock()
+        for city in cities:
+            self.due.setdefault(city, now)
+        for city in [c for c in self.due if c not in cities]:
+            self.remove(city)
+
+    def remove(self, city: str):
+        self.due.pop(city, None)
+        self.failures.pop(city, None)
+
+    def pop_due(self, only: list[str] | None = None) -> list[str]:
+        # with `only`, cities outside it stay due (and stale) and the result follows its order
+        now = self.clock()
+        candidates = self.due if only is None else [c for c in only if c in self.due]
+        ready = [c for c in candidates if self.due[c] <= now]
+        self.mark_in_flight(ready)
+        return ready
+
+    def mark_in_flight(self, cities: list[str]):
+        # if no answer arrives the city simply becomes due again
+        until = self.clock() + IN_FLIGHT_TIMEOUT_S
+        for city in cities:
+            self.due[city] = until
+
+    def on_success(self, city: str):
+        if city not in self.due:
+            return
+        self.failures.pop(city, None)
+        now = self.clock()
+        slot_start = (now - self.publish_delay) // self.cadence * self.cadence + self.publish_delay
+        due = slot_start + self.interval + self.phase(city) + self.jitter()
+        self.due[city] = max(due, now + 60)
+
+    def on_failure(self, city: str):
+        if city not in self.due:
+            return
+        n = self.failures.get(city, 0) + 1
+        self.failures[city] = n
+        delay = min(MAX_BACKOFF_S, RETRY_BASE_S * 2 ** (n - 1))
+        self.due[city] = self.clock() + delay * (0.8 + 0.4 * self.rng())
+
+    def seconds_until_next(self, only: list[str] | None = None) -> float | None:
+        times = self.due.values() if only is None else [self.due[c] for c in only if c in self.due]
+        if not times:
+            return None
+        return max(0.0, min(times) - self.clock())
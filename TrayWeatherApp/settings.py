@@ -63,53 +63,7 @@ class SettingsDialog(QDialog):
         self.apply_theme_to_dialog()
 
     def apply_theme_to_dialog(self):
-        t = self.theme_manager
-        bg = t.value("glass_card_color", "rgba(20,22,30,150)")
-        text = t.value("text_primary", "#E6E8EE")
-        accent = t.value("link_color", "#7DD3FC")
-
-        bright_theme = any(name in t.value("name", "").lower() for name in ["light", "beach", "sand", "day"])
-        if bright_theme:
-            bg = "rgba(255,255,255,0.95)"
-            text = "#1B263B"
-            accent = "#0D47A1"
-
-        qss = f"""
-        QDialog {{
-            background-color: {bg};
-            color: {text};
-            font-family: "Segoe UI";
-        }}
-        QLabel, QCheckBox {{
-            color: {text};
-        }}
-        QComboBox, QLineEdit {{
-            background: {'rgba(255,255,255,0.9)' if bright_theme else 'rgba(255,255,255,0.05)'};
-            color: {text};
-            border: 1px solid {'rgba(0,0,0,0.2)' if bright_theme else 'rgba(255,255,255,0.15)'};
-            border-radius: 6px;
-            padding: 4px 8px;
-        }}
-        QComboBox QAbstractItemView {{
-            background: {'white' if bright_theme else '#232323'};
-            color: {text};
-            selection-background-color: {'#E0E0E0' if bright_theme else '#444'};
-        }}
-        QPushButton {{
-            background-color: {accent};
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 6px 12px;
-        }}
-        QPushButton:hover {{
-            background-color: {accent}CC;
-        }}
-        QPushButton:pressed {{
-            background-color: {accent}99;
-        }}
-        """
-        self.setStyleSheet(qss)
+        self.setStyleSheet(self.theme_manager.stylesheet("dialog"))
 
     def get_values(self):
         return {
@@ -0,0 +1,74 @@
+# TrayWeatherApp module: startup.py
+
+import json, os, sys, time
+
+T0 = time.perf_counter()
+REPORT_FLAG = "--startup-report"
+EXIT_FLAG = "--startup-exit"
+TOP_IMPORTS = 25
+
+# ---------- Phase marks ----------
+marks = []
+
+def mark(name: str):
+    marks.append((name, time.perf_counter() - T0))
+
+def exit_requested() -> bool:
+    return EXIT_FLAG in sys.argv
+
+def dump_marks():
+    # the report parent reads this line back from the child's stdout
+    sys.stdout.write(json.dumps({"marks": [[n, round(t * 1000, 2)] for n, t in marks]}) + "\n")
+    sys.stdout.flush()
+
+# ---------- Report ----------
+def parse_importtime(stderr: str) -> list[dict]:
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({"module": name.strip(), "self_ms": int(self_us) / 1000,
+                         "cumulative_ms": int(cumulative_us) / 1000, "depth": (len(name) - len(name.lstrip())) // 2})
+        except ValueError:
+            continue
+    return rows
+
+def report(argv=None) -> int:
+    # re-run the app in a child with -X importtime, stop it once the window exists, then summarize both
+    import subprocess
+    if getattr(sys, "frozen", False):
+        cmd = [sys.executable, EXIT_FLAG]
+    else:
+        cmd = [sys.executable, "-X", "importtime", "-m", "TrayWeatherApp", EXIT_FLAG]
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=dict(os.environ))
+    wall = time.perf_counter() - started
+    child_marks = []
+    for line in proc.stdout.splitlines():
+        if line.startswith('{"marks"'):
+            child_marks = json.loads(line)["marks"]
+    imports = parse_importtime(proc.stderr)
+    top = sorted((r for r in imports if r["depth"] <= 1), key=lambda r: r["cumulative_ms"], reverse=True)
+    result = {
+        "wall_ms": round(wall * 1000, 2),
+        "returncode": proc.returncode,
+        "marks_ms": dict(child_marks),
+        "imports_total_ms": round(sum(r["self_ms"] for r in imports), 2),
+        "top_imports": top[:TOP_IMPORTS],
+    }
+    if "--json" in (argv or []):
+        print(json.dumps(result, indent=2))
+        return proc.returncode
+
+    print(f"Startup report (process wall {result['wall_ms']:.0f} ms)")
+    print("\nPhases (ms since interpreter reached TrayWeatherApp):")
+    for name, ms in child_marks:
+        print(f"  {ms:9.1f}  {name}")
+    print(f"\nImports: {result['imports_total_ms']:.1f} ms total; top level by cumulative time:")
+    for r in result["top_imports"]:
+        print(f"  {r['cumulative_ms']:9.1f}  {'  ' * r['depth']}{r['module']}")
+    if proc.returncode != 0:
+        print(f"\nchild exited with {proc.returncode}:\n{proc.stderr[-1500:]}", file=sys.stderr)
+    return proc.returncode
@@ -1,37 +1,171 @@
 # TrayWeatherApp module: theme.py
 
-from PyQt6.QtGui import QColor, QPalette
+from collections import OrderedDict
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPalette, QPixmap, QPainter, QLinearGradient
 from PyQt6.QtWidgets import QApplication
-from TrayWeatherApp.config_utils import THEMES_DIR
+from TrayWeatherApp.config_utils import THEMES_DIR, log
+from TrayWeatherApp.metrics import timed
 import re, zipfile, json, io, colorsys
 
+RGBA_RE = re.compile(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)")
+DEFAULT_GRADIENT = ["#12141A", "#1A2036"]
+
+# ---------- Stylesheet builders ----------
+def tabs_qss(data: dict) -> str:
+    tab_bg = data.get("tab_bg", "rgba(255,255,255,10)")
+    tab_sel_bg = data.get("tab_bg_selected", "rgba(255,255,255,18)")
+    tab_color = data.get("tab_text", "#E6E8EE")
+    tab_border = data.get("tab_border", "rgba(255,255,255,25)")
+    return f"""
+        QTabWidget::pane{{border:0;}}
+        QTabBar::tab{{
+            background:{tab_bg};
+            color:{tab_color};
+            border:1px solid {tab_border};
+            border-bottom:0;
+            border-radius:10px;
+            padding:6px 16px;
+            margin-right:2px;
+        }}
+        QTabBar::tab:selected{{
+            background:{tab_sel_bg};
+        }}
+    """
+
+def dialog_qss(data: dict) -> str:
+    bg = data.get("glass_card_color", "rgba(20,22,30,150)")
+    text = data.get("text_primary", "#E6E8EE")
+    accent = data.get("link_color", "#7DD3FC")
+
+    bright_theme = any(name in data.get("name", "").lower() for name in ["light", "beach", "sand", "day"])
+    if bright_theme:
+        bg = "rgba(255,255,255,0.95)"
+        text = "#1B263B"
+        accent = "#0D47A1"
+
+    return f"""
+    QDialog {{
+        background-color: {bg};
+        color: {text};
+        font-family: "Segoe UI";
+    }}
+    QLabel, QCheckBox {{
+        color: {text};
+    }}
+    QComboBox, QLineEdit {{
+        background: {'rgba(255,255,255,0.9)' if bright_theme else 'rgba(255,255,255,0.05)'};
+        color: {text};
+        border: 1px solid {'rgba(0,0,0,0.2)' if bright_theme else 'rgba(255,255,255,0.15)'};
+        border-radius: 6px;
+        padding: 4px 8px;
+    }}
+    QTableWidget {{
+        background: {'rgba(255,255,255,0.9)' if bright_theme else 'rgba(255,255,255,0.04)'};
+        color: {text};
+        gridline-color: {'rgba(0,0,0,0.12)' if bright_theme else 'rgba(255,255,255,0.08)'};
+        border: 1px solid {'rgba(0,0,0,0.2)' if bright_theme else 'rgba(255,255,255,0.15)'};
+        border-radius: 6px;
+    }}
+    QHeaderView, QTableCornerButton::section {{
+        background-color: transparent;
+    }}
+    QHeaderView::section {{
+        background-color: {'rgba(0,0,0,0.06)' if bright_theme else 'rgba(255,255,255,0.08)'};
+        color: {text};
+        border: none;
+        padding: 4px 6px;
+    }}
+    QComboBox QAbstractItemView {{
+        background: {'white' if bright_theme else '#232323'};
+        color: {text};
+        selection-background-color: {'#E0E0E0' if bright_theme else '#444'};
+    }}
+    QPushButton {{
+        background-color: {accent};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 6px 12px;
+    }}
+    QPushButton:hover {{
+        background-color: {accent}CC;
+    }}
+    QPushButton:pressed {{
+        background-color: {accent}99;
+    }}
+    """
+
+STYLESHEET_BUILDERS = {"tabs": tabs_qss, "dialog": dialog_qss}
+
+# ---------- Compiled Theme ----------
+class CompiledTheme:
+    def __init__(self, name: str, mtime: int, css: str, data: dict):
+        self.name = name
+        self.mtime = mtime
+        self.css = css
+        self.data = data
+        self.colors = {}
+        for key, val in data.items():
+            if isinstance(val, str):
+                col = ThemeManager.parse_color(val)
+                if col.isValid():
+                    self.colors[key] = col
+        stops = data.get("background_gradient", DEFAULT_GRADIENT)
+        if not isinstance(stops, list) or not stops:
+            stops = DEFAULT_GRADIENT
+        last = max(1, len(stops) - 1)
+        self.gradient = [(i / last, QColor(c)) for i, c in enumerate(stops)]
+        self.link_color = self._auto_link_color()
+        self.qss = {kind: build(data) for kind, build in STYLESHEET_BUILDERS.items()}
+
+    def _auto_link_color(self) -> str:
+        brightness = ThemeManager.luminance(self.gradient[0][1])
+        return "#0A3D62" if brightness > 0.6 else "#7DD3FC"
+
 # ---------- Theme Manager ----------
 class ThemeManager:
     def __init__(self):
         self.current_name = None
         self.current_css = ""
         self.current_json = {}
-        self.cache = {}
+        self.current = None
+        self._gradients = OrderedDict()
+        self.index = {}
+        self._names = []
+        self._dir_mtime = None
+        self._default_colors = {}
 
     def list_themes(self):
-        names = []
-        for z in THEMES_DIR.glob("*.zip"):
-            names.append(z.stem)
-        return sorted(names)
+        try:
+            mtime = THEMES_DIR.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if mtime != self._dir_mtime:
+            self._names = sorted(z.stem for z in THEMES_DIR.glob("*.zip"))
+            self._dir_mtime = mtime
+        return list(self._names)
 
     def load_theme(self, name: str):
-        if name in self.cache:
-            self.current_name = name
-            self.current_css, self.current_json = self.cache[name]
-            return
-
         zip_path = THEMES_DIR / f"{name}.zip"
-        if not zip_path.exists():
-            raise FileNotFoundError(f"Theme ZIP not found: {zip_path}")
+        try:
+            mtime = zip_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Theme ZIP not found: {zip_path}") from None
 
-        with zip_path.open("rb") as f:
-            data = f.read()
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        entry = self.index.get(name)
+        if entry is None or entry.mtime != mtime:
+            entry = self.compile_theme(name, zip_path, mtime)
+            self.index[name] = entry
+            log(f"Compiled theme '{name}'")
+
+        self.current = entry
+        self.current_name = name
+        self.current_css = entry.css
+        self.current_json = entry.data
+
+    def compile_theme(self, name: str, zip_path, mtime: int) -> CompiledTheme:
+        with zipfile.ZipFile(zip_path) as zf:
             css_name = None
             json_name = None
             for n in zf.namelist():
@@ -49,40 +183,32 @@ class ThemeManager:
             json_obj = json.loads(json_text)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in theme '{name}': {e}") from e
+        return CompiledTheme(name, mtime, css_text, json_obj)
 
-        self.cache[name] = (css_text, json_obj)
-        self.current_name = name
-        self.current_css = css_text
-        self.current_json = json_obj
-
-    def _luminance(self, hex_color: str) -> float:
-        qc = QColor(hex_color)
-        r, g, b = qc.redF(), qc.greenF(), qc.blueF()
+    @staticmethod
+    def luminance(color: QColor) -> float:
+        r, g, b = color.redF(), color.greenF(), color.blueF()
         return colorsys.rgb_to_hls(r, g, b)[1]
 
     def _auto_link_color(self) -> str:
-        link = self.value("link_color", "#7DD3FC")
-        bg = self.value("background_gradient", ["#12141A", "#1A2036"])
-        bg_hex = bg[0] if isinstance(bg, list) and bg else "#12141A"
-        brightness = self._luminance(bg_hex)
-        if brightness > 0.6:
-            return "#0A3D62"
-        else:
-            return "#7DD3FC"
+        if self.current is not None:
+            return self.current.link_color
+        return "#7DD3FC"
 
+    @timed("theme.apply_to_app")
     def apply_to_app(self, app: QApplication):
         app.setStyleSheet(self.current_css or "")
 
         pal = app.palette()
 
-        text_hex = self.value("text_primary", "#E6E8EE")
-        link_hex = self._auto_link_color()
+        text = self.color("text_primary", "#E6E8EE")
+        link = QColor(self._auto_link_color())
 
-        pal.setColor(QPalette.ColorRole.WindowText, QColor(text_hex))
-        pal.setColor(QPalette.ColorRole.Text, QColor(text_hex))
-        pal.setColor(QPalette.ColorRole.ButtonText, QColor(text_hex))
-        pal.setColor(QPalette.ColorRole.Link, QColor(link_hex))
-        pal.setColor(QPalette.ColorRole.LinkVisited, QColor(link_hex))
+        pal.setColor(QPalette.ColorRole.WindowText, text)
+        pal.setColor(QPalette.ColorRole.Text, text)
+        pal.setColor(QPalette.ColorRole.ButtonText, text)
+        pal.setColor(QPalette.ColorRole.Link, link)
+        pal.setColor(QPalette.ColorRole.LinkVisited, link)
 
         app.setPalette(pal)
 
@@ -92,7 +218,7 @@ class ThemeManager:
             return QColor(default)
         s = value.strip()
         if s.startswith("rgba"):
-            m = re.match(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)", s)
+            m = RGBA_RE.match(s)
             if m:
                 r, g, b, a = m.groups()
                 a_val = float(a)
@@ -104,5 +230,53 @@ class ThemeManager:
         except Exception:
             return QColor(default)
 
+    def color(self, key: str, default: str = "#000000") -> QColor:
+        if self.current is not None and key in self.current.colors:
+            return QColor(self.current.colors[key])
+        col = self._default_colors.get(default)
+        if col is None:
+            col = self._default_colors[default] = self.parse_color(default)
+        return QColor(col)
+
+    def gradient_stops(self):
+        if self.current is not None:
+            return self.current.gradient
+        return [(0.0, QColor(DEFAULT_GRADIENT[0])), (1.0, QColor(DEFAULT_GRADIENT[1]))]
+
+    GRADIENT_CACHE_SIZE = 16
+    GRADIENT_STRIP_WIDTH = 32
+
+    def gradient_strip(self, height: int, dpr: float = 1.0) -> QPixmap:
+        # the gradient is vertical, so one narrow strip per height is tiled across any width
+        theme_key = (self.current.name, self.current.mtime) if self.current is not None else None
+        key = (theme_key, height, round(dpr, 2))
+        strip = self._gradients.get(key)
+        if strip is not None:
+            self._gradients.move_to_end(key)
+            return strip
+        strip = QPixmap(round(self.GRADIENT_STRIP_WIDTH * dpr), max(1, round(height * dpr)))
+        strip.setDevicePixelRatio(dpr)
+        g = QLinearGradient(0, 0, 0, height)
+        for pos, col in self.gradient_stops():
+            g.setColorAt(pos, col)
+        p = QPainter(strip)
+        p.fillRect(0, 0, self.GRADIENT_STRIP_WIDTH, max(1, height), g)
+        p.end()
+        self._gradients[key] = strip
+        while len(self._gradients) > self.GRADIENT_CACHE_SIZE:
+            self._gradients.popitem(last=False)
+        return strip
+
+    def paint_gradient(self, widget):
+        p = QPainter(widget)
+        p.drawTiledPixmap(widget.rect(), self.gradient_strip(widget.height(), widget.devicePixelRatioF()))
+        p.end()
+
+    def stylesheet(self, kind: str) -> str:
+        if self.current is not None:
+            return self.current.qss.get(kind, "")
+        build = STYLESHEET_BUILDERS.get(kind)
+        return build({}) if build else ""
+
     def value(self, key: str, default=None):
         return self.current_json.get(key, default)
@@ -0,0 +1,115 @@
+# TrayWeatherApp module: timeseries.py
+
+from array import array
+from bisect import bisect_left
+import math, threading
+
+HOURLY_FIELDS = ("temperature_2m", "precipitation", "wind_speed_10m", "weather_code")
+DAILY_FIELDS = ("temperature_2m_max", "temperature_2m_min", "weather_code")
+FORECAST_DAYS = 7
+
+# weather codes fit in a signed byte; -1 marks a missing value, NaN does the same for float columns
+CODE_MISSING = -1
+
+# ---------- Series Block ----------
+class SeriesBlock:
+    __slots__ = ("times", "columns")
+
+    def __init__(self, times: array, columns: dict):
+        self.times = times
+        self.columns = columns
+
+    @classmethod
+    def from_payload(cls, block: dict | None, fields) -> "SeriesBlock":
+        block = block or {}
+        times = array("q", (int(t) for t in block.get("time") or []))
+        columns = {}
+        for name in fields:
+            values = block.get(name) or []
+            if name == "weather_code":
+                col = array("b", (CODE_MISSING if v is None else int(v) for v in values))
+            else:
+                col = array("d", (math.nan if v is None else float(v) for v in values))
+            # pad short columns so every column lines up with the time axis
+            missing = len(times) - len(col)
+            if missing > 0:
+                col.extend([CODE_MISSING if col.typecode == "b" else math.nan] * missing)
+            columns[name] = col[:len(times)]
+        return cls(times, columns)
+
+    def __len__(self):
+        return len(self.times)
+
+    def window(self, start: int, end: int) -> "SeriesView":
+        # times are epoch seconds in ascending order, so the window is found by bisection
+        i = bisect_left(self.times, start)
+        j = bisect_left(self.times, end, lo=i)
+        return SeriesView(self, i, j)
+
+    def head(self, count: int) -> "SeriesView":
+        return SeriesView(self, 0, min(count, len(self.times)))
+
+# ---------- Series View ----------
+class SeriesView:
+    __slots__ = ("block", "start", "stop")
+
+    def __init__(self, block: SeriesBlock, start: int, stop: int):
+        self.block = block
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    @property
+    def times(self) -> memoryview:
+        return memoryview(self.block.times)[self.start:self.stop]
+
+    def column(self, name: str) -> memoryview:
+        # memoryview slices share the underlying buffer, nothing is copied
+        return memoryview(self.block.columns[name])[self.start:self.stop]
+
+# ---------- City Series ----------
+class CitySeries:
+    __slots__ = ("hourly", "daily", "utc_offset")
+
+    def __init__(self, hourly: SeriesBlock, daily: SeriesBlock, utc_offset: int = 0):
+        self.hourly = hourly
+        self.daily = daily
+        self.utc_offset = utc_offset
+
+    @classmethod
+    def from_payload(cls, d: dict) -> "CitySeries":
+        return cls(
+            SeriesBlock.from_payload(d.get("hourly"), HOURLY_FIELDS),
+            SeriesBlock.from_payload(d.get("daily"), DAILY_FIELDS),
+            d.get("utc_offset_seconds", 0),
+        )
+
+    def next_hours(self, now: float, hours: int) -> SeriesView:
+        start = int(now) - int(now) % 3600
+        return self.hourly.window(start, start + hours * 3600)
+
+# ---------- Forecast Store ----------
+class ForecastStore:
+    def __init__(self):
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def put(self, city: str, series: CitySeries):
+        with self._lock:
+            self._series[city] = series
+
+    def get(self, city: str) -> CitySeries | None:
+        with self._lock:
+            return self._series.get(city)
+
+    def discard(self, city: str):
+        with self._lock:
+            self._series.pop(city, None)
+
+    def cities(self) -> list[str]:
+        with self._lock:
+            return list(self._series)
+
+forecast_store = ForecastStore()
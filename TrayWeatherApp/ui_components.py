@@ -15,12 +15,14 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QSpacerItem
 )
-from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-from TrayWeatherApp.config_utils import log, set_sun_icon, enable_windows_acrylic
+from TrayWeatherApp.config_utils import log, set_sun_icon, enable_windows_acrylic, cached_font, glow_pixmap
 from TrayWeatherApp.theme import ThemeManager
+from TrayWeatherApp.metrics import timed
 
 # ---------- Glass Card ----------
 class GlassCard(QWidget):
+    ICON_PX = 128
+
     def __init__(self, app_ref):
         super().__init__()
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
@@ -29,15 +31,21 @@ class GlassCard(QWidget):
         self.app_ref = app_ref
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.radius = 22
+        self.scale_key = None
         self.bg_color = QColor(20,22,30,150)  # will be replaced in apply_theme_to_card
-        self.icon_lbl = QLabel("☀️"); self.icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_lbl.setFont(QFont("Segoe UI Emoji", 120))
-        glow = QGraphicsDropShadowEffect(self.icon_lbl); glow.setBlurRadius(30)
-        glow.setColor(QColor(255, 200, 120, 90)); glow.setOffset(0,0)
-        self.icon_lbl.setGraphicsEffect(glow)
+        self.icon_lbl = QLabel(); self.icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.glyph = "☀️"
+        self.icon_px = self.ICON_PX
+        self.icon_key = None
+        self.glow_color = QColor(255, 200, 120, 90)
+        self.glyph_color = QColor("#E6E8EE")
+        # last text pushed into each label; see set_label()
+        self.rendered = {}
         self.city_lbl = QLabel("City")
         self.time_lbl = QLabel("🕒 --:--")
-        city_row = QHBoxLayout(); city_row.addWidget(self.city_lbl); city_row.addWidget(self.time_lbl); city_row.addStretch(1)
+        self.age_lbl = QLabel("")
+        city_row = QHBoxLayout(); city_row.addWidget(self.city_lbl); city_row.addWidget(self.time_lbl)
+        city_row.addWidget(self.age_lbl); city_row.addStretch(1)
         self.temp_lbl = QLabel("-°")
         self.desc_lbl = QLabel("-")
         self.more_lbl = QLabel("-"); self.more_lbl.setWordWrap(True)
@@ -47,11 +55,22 @@ class GlassCard(QWidget):
         row.addWidget(self.icon_lbl,1); row.addLayout(right,3)
         self.apply_theme_to_card()
 
+    def reset(self):
+        self.city_lbl.setText("City")
+        self.time_lbl.setText("🕒 --:--")
+        self.age_lbl.setText("")
+        self.age_lbl.setToolTip("")
+        self.temp_lbl.setText("-°")
+        self.desc_lbl.setText("-")
+        self.more_lbl.setText("-")
+        self.set_icon("☀️")
+        self.rendered.clear()
+        for attr in ("tz_offset", "fetched_at", "fetch_error", "clock_minute"):
+            self.__dict__.pop(attr, None)
+
     def apply_theme_to_card(self):
         t = self.app_ref.theme
         # colors
-        glass = t.value("glass_card_color", "rgba(20,22,30,150)")
-        border = t.value("card_border_color", "rgba(255,255,255,25)")
         text_primary = t.value("text_primary", "#E6E8EE")
         text_muted = t.value("text_muted", "#9EA3B8")
         text_desc = t.value("text_desc", "#C5C9D3")
@@ -61,22 +80,22 @@ class GlassCard(QWidget):
         low_color  = t.value("low_color",  "#7DD3FC")
         humid_color= t.value("humid_color","#7DD3FC")
         wind_color = t.value("wind_color", "#C4B5FD")
-        glow_color = t.value("accent_glow", "#FFC878")
 
-        self.bg_color = ThemeManager.parse_color(glass, "rgba(20,22,30,150)")
-        self._border_color = ThemeManager.parse_color(border, "rgba(255,255,255,25)")
+        self.bg_color = t.color("glass_card_color", "rgba(20,22,30,150)")
+        self._border_color = t.color("card_border_color", "rgba(255,255,255,25)")
 
         self.city_lbl.setStyleSheet(f"color:{text_primary};")
-        self.city_lbl.setFont(QFont("Segoe UI",22,QFont.Weight.Bold))
+        self.city_lbl.setFont(cached_font("Segoe UI", 22, QFont.Weight.Bold))
         self.time_lbl.setStyleSheet(f"color:{text_muted}; margin-left:12px;")
+        self.age_lbl.setStyleSheet(f"color:{text_muted}; margin-left:8px;")
         self.temp_lbl.setStyleSheet(f"color:{temp_color};")
-        self.temp_lbl.setFont(QFont("Segoe UI",42))
+        self.temp_lbl.setFont(cached_font("Segoe UI", 42))
         self.desc_lbl.setStyleSheet(f"color:{text_desc};")
         self.more_lbl.setStyleSheet(f"color:{text_more};")
 
-        glow = self.icon_lbl.graphicsEffect()
-        if isinstance(glow, QGraphicsDropShadowEffect):
-            glow.setColor(ThemeManager.parse_color(glow_color, "#FFC878"))
+        self.glow_color = t.color("accent_glow", "#FFC878")
+        self.glyph_color = t.color("text_primary", "#E6E8EE")
+        self.set_icon(self.glyph)
 
         self._colors = {
             "temp": temp_color,
@@ -86,8 +105,32 @@ class GlassCard(QWidget):
             "wind": wind_color,
         }
 
+        self.scale_key = None  # fonts were reset above, the window has to scale this card again
         self.update()
-        self.repaint()
+
+    def set_label(self, name: str, text: str) -> bool:
+        # unchanged values skip setText() and the relayout (rich text for more_lbl) it triggers
+        if self.rendered.get(name) == text:
+            return False
+        getattr(self, name).setText(text)
+        self.rendered[name] = text
+        return True
+
+    def set_tooltip(self, name: str, text: str):
+        key = name + ".tooltip"
+        if self.rendered.get(key) != text:
+            getattr(self, name).setToolTip(text)
+            self.rendered[key] = text
+
+    def set_icon(self, glyph: str, size: int | None = None):
+        if size is not None:
+            self.icon_px = size
+        self.glyph = glyph
+        key = (glyph, self.icon_px, self.glow_color.rgba(), self.glyph_color.rgba())
+        if key == self.icon_key:
+            return
+        self.icon_lbl.setPixmap(glow_pixmap(glyph, self.icon_px, self.glow_color, self.glyph_color))
+        self.icon_key = key
 
     def themed_detail_html(self, feels, high, low, humid, wind, units_t, units_w):
         c = self._colors
@@ -99,6 +142,7 @@ class GlassCard(QWidget):
             f"💨 Wind: <span style='color:{c['wind']}'>{wind} {units_w}</span>"
         )
 
+    @timed("card.paint")
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -0,0 +1,40 @@
+# TrayWeatherApp module: units.py
+
+# observations are fetched and cached in °C and m/s; metric/imperial only exist at render time
+CANONICAL = "si"
+TEMP_FIELDS = ("temp", "feels_like", "high", "low")
+WIND_FIELDS = ("wind_speed",)
+LABELS = {
+    "metric": ("C", "km/h"),
+    "imperial": ("F", "mph"),
+}
+
+def labels(units: str) -> tuple[str, str]:
+    return LABELS.get(units, LABELS["metric"])
+
+def temp(celsius, units: str):
+    if not isinstance(celsius, (int, float)):
+        return None
+    return celsius * 9 / 5 + 32 if units == "imperial" else float(celsius)
+
+def wind(metres_per_second, units: str):
+    if not isinstance(metres_per_second, (int, float)):
+        return None
+    return metres_per_second * (2.236936 if units == "imperial" else 3.6)
+
+def fmt(value, digits: int = 1, missing: str = "-") -> str:
+    return missing if value is None else f"{value:.{digits}f}"
+
+def localize_info(info: dict, units: str) -> dict:
+    # converted copy for consumers that want plain numbers (CLI output, the legacy WeatherWorker)
+    out = dict(info)
+    for key in TEMP_FIELDS:
+        if key in out:
+            value = temp(out[key], units)
+            out[key] = None if value is None else round(value, 1)
+    for key in WIND_FIELDS:
+        if key in out:
+            value = wind(out[key], units)
+            out[key] = None if value is None else round(value, 1)
+    out["units"] = units
+    return out
@@ -2,7 +2,7 @@
 
 from PyQt6.QtCore import Qt
 from datetime import datetime, timezone, timedelta
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QEvent
 from PyQt6.QtGui import (
     QPixmap, QFont, QIcon, QPainter, QLinearGradient, QColor,
     QPainterPath
@@ -10,35 +10,67 @@ from PyQt6.QtGui import (
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QInputDialog, QToolButton, QTabBar,
     QLabel, QSizePolicy, QSpacerItem, QDialog, QFormLayout, QComboBox,
-    QCheckBox, QPushButton, QHBoxLayout
+    QCheckBox, QPushButton, QHBoxLayout, QStackedWidget
 )
 
-from TrayWeatherApp.config_utils import set_sun_icon, create_tray_icon, enable_windows_acrylic, log
+from TrayWeatherApp.config_utils import set_sun_icon, create_tray_icon, enable_windows_acrylic, log, cached_font
 from TrayWeatherApp.ui_components import GlassCard
+from TrayWeatherApp.overview import CityOverview, CITY_ROLE
+from TrayWeatherApp.timeseries import forecast_store
+from TrayWeatherApp.metrics import timed
+from TrayWeatherApp import units
+import time
+
+def format_age(seconds: float) -> str:
+    minutes = int(max(0, seconds) // 60)
+    if minutes < 1:
+        return "just now"
+    if minutes < 60:
+        return f"{minutes} min ago"
+    if minutes < 48 * 60:
+        return f"{minutes // 60} h ago"
+    return f"{minutes // (24 * 60)} d ago"
 
 # ---------- Weather Window ----------
 class WeatherWindow(QWidget):
+    RESIZE_SETTLE_MS = 80
+
     def __init__(self, app_ref):
         super().__init__()
         self.app_ref = app_ref
         self.city_tabs = {}
+        self.tray_icon_key = None
+        self.tray_tooltip = None
         self.setWindowTitle("TrayWeatherApp")
         set_sun_icon(self)
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self.resize_timer.timeout.connect(self.on_resize_settled)
         self.resize(*app_ref.config.get("window_size", [760, 440]))
         self.move(*app_ref.config.get("window_pos", [100, 100]))
         enable_windows_acrylic(self)
 
         self.tabs = QTabWidget()
         self.tabs.setMovable(True)
-        self.tabs.setTabsClosable(True)
+        # a per-tab close button makes QTabBar relayout every tab on each insert (O(n^2) startup),
+        # so a single button follows the current tab instead
+        self.tabs.setTabsClosable(False)
         self.tabs.tabCloseRequested.connect(self.remove_tab)
         self.tabs.currentChanged.connect(self.check_fake_tab)
+        self.tabs.currentChanged.connect(self.on_current_tab_changed)
         self.apply_theme_to_tabs()
+        self.close_btn = self.make_close_button()
+        self.close_btn_owner = None
+
+        self.overview = None
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.tabs)
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(18, 18, 18, 18)
         lay.setSpacing(0)
-        lay.addWidget(self.tabs)
+        lay.addWidget(self.stack)
 
         # credit label
         self.credit_lbl = QLabel(
@@ -47,11 +79,25 @@ class WeatherWindow(QWidget):
         self.credit_lbl.setOpenExternalLinks(True)
         self.credit_lbl.setAlignment(Qt.AlignmentFlag.AlignRight)
         self.apply_theme_to_credit()
-        lay.addWidget(self.credit_lbl, alignment=Qt.AlignmentFlag.AlignRight)
+        self.view_btn = QToolButton()
+        self.view_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.view_btn.setStyleSheet("QToolButton { background: transparent; border: none; font-size: 11px; margin-top: 4px; }")
+        self.view_btn.clicked.connect(self.toggle_view_mode)
+        bottom = QHBoxLayout()
+        bottom.addWidget(self.view_btn)
+        bottom.addStretch(1)
+        bottom.addWidget(self.credit_lbl)
+        lay.addLayout(bottom)
 
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         self.setAutoFillBackground(False)
 
+        # one wall-clock aligned ticker for every card, only running while the window is shown
+        self.clock_timer = QTimer(self)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.clock_timer.timeout.connect(self.on_minute_tick)
+
     def apply_theme_to_credit(self):
 
         # Rich text + external links
@@ -69,66 +115,114 @@ class WeatherWindow(QWidget):
         self.credit_lbl.update()
 
     def apply_theme_to_tabs(self):
-        t = self.app_ref.theme
-        tab_bg = t.value("tab_bg", "rgba(255,255,255,10)")
-        tab_sel_bg = t.value("tab_bg_selected", "rgba(255,255,255,18)")
-        tab_color = t.value("tab_text", "#E6E8EE")
-        tab_border = t.value("tab_border", "rgba(255,255,255,25)")
-        qss = f"""
-            QTabWidget::pane{{border:0;}}
-            QTabBar::tab{{
-                background:{tab_bg};
-                color:{tab_color};
-                border:1px solid {tab_border};
-                border-bottom:0;
-                border-radius:10px;
-                padding:6px 16px;
-                margin-right:2px;
-            }}
-            QTabBar::tab:selected{{
-                background:{tab_sel_bg};
-            }}
-        """
-        self.tabs.setStyleSheet(qss)
+        self.tabs.setStyleSheet(self.app_ref.theme.stylesheet("tabs"))
 
     def eventFilter(self, obj, event):
         if event.type() == event.Type.Paint and isinstance(obj, QWidget):
-            p = QPainter(obj)
-            g = QLinearGradient(0, 0, 0, obj.height())
-            c0, c1 = self.app_ref.theme.value("background_gradient", ["#12141A", "#1A2036"])
-            g.setColorAt(0, QColor(c0))
-            g.setColorAt(1, QColor(c1))
-            p.fillRect(obj.rect(), g)
+            self.app_ref.theme.paint_gradient(obj)
             return False
         return super().eventFilter(obj, event)
 
     def retheme(self):
         self.apply_theme_to_tabs()
         self.apply_theme_to_credit()
+        if self.overview is not None:
+            self.overview.retheme()
         for data in self.city_tabs.values():
             card: GlassCard = data.get("card")
             if card:
                 card.apply_theme_to_card()
-                card.update()
-                card.repaint()
+                self.update_card_scaling(card)
+        # the detail HTML carries theme colors inline too
+        self.rerender()
         self.update()
-        self.repaint()
 
     def paintEvent(self, e):
-        p = QPainter(self)
-        g = QLinearGradient(0, 0, 0, self.height())
-        col0, col1 = self.app_ref.theme.value("background_gradient", ["#12141A", "#1A2036"])
-        g.setColorAt(0, QColor(col0))
-        g.setColorAt(1, QColor(col1))
-        p.fillRect(self.rect(), g)
+        self.app_ref.theme.paint_gradient(self)
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        self.repaint()
-        for data in self.city_tabs.values():
-            card = data.get("card")
-            if card:
-                card.repaint()
+        # Qt already schedules a repaint for the resized area; font rescaling waits until dragging pauses
+        self.resize_timer.start()
+
+    def on_resize_settled(self):
+        self.update_card_scaling(self.current_card())
+        self.update()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self.on_current_tab_changed(self.tabs.currentIndex())
+        self.schedule_minute_tick()
+        self.app_ref.on_window_shown()
+
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        # restoring from minimized counts as showing for the refresh tiers
+        if e.type() == QEvent.Type.WindowStateChange and self.isVisible() and not self.isMinimized():
+            self.app_ref.on_window_shown()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self.clock_timer.stop()
+
+    # ---------- Clock ----------
+    def schedule_minute_tick(self):
+        now = time.time()
+        # land just past the boundary so strftime already shows the new minute
+        self.clock_timer.start(int((60 - now % 60) * 1000) + 20)
+
+    def on_minute_tick(self):
+        self.refresh_card_clock(self.current_card())
+        if self.isVisible():
+            self.schedule_minute_tick()
+
+    def refresh_card_clock(self, card):
+        if card is None or not hasattr(card, "time_lbl"):
+            return
+        if getattr(card, "clock_minute", None) != int(time.time() // 60):
+            self.update_card_time(card)
+
+    def on_current_tab_changed(self, index):
+        self.place_close_button()
+        city = self.city_for_widget(self.tabs.currentWidget())
+        if city is None or not self.isVisible():
+            return
+        card = self.ensure_card(city)
+        self.update_card_scaling(card)
+        self.refresh_card_clock(card)
+
+    # ---------- Overview ----------
+    def set_view_mode(self, mode: str):
+        if mode == "list":
+            if self.overview is None:
+                self.overview = CityOverview(self.app_ref)
+                self.overview.doubleClicked.connect(self.open_overview_city)
+                self.stack.addWidget(self.overview)
+            self.sync_overview()
+            self.stack.setCurrentWidget(self.overview)
+            self.view_btn.setText("🗂 Tabs")
+        else:
+            mode = "tabs"
+            self.stack.setCurrentWidget(self.tabs)
+            self.view_btn.setText("☰ List")
+            self.on_current_tab_changed(self.tabs.currentIndex())
+        if self.app_ref.config.get("view_mode") != mode:
+            self.app_ref.config["view_mode"] = mode
+
+    def toggle_view_mode(self):
+        self.set_view_mode("tabs" if self.stack.currentWidget() is self.overview else "list")
+
+    def sync_overview(self):
+        if self.overview is None:
+            return
+        infos = {city: data["info"] for city, data in self.city_tabs.items() if "info" in data}
+        self.overview.model_.set_cities(self.get_tab_city_order(), infos)
+
+    def open_overview_city(self, index):
+        city = index.data(CITY_ROLE)
+        if city in self.city_tabs:
+            self.tabs.setCurrentWidget(self.city_tabs[city]["container"])
+            self.set_view_mode("tabs")
 
     # ---------- Window Save/Restore ----------
     def save_window_geometry(self):
@@ -137,16 +231,22 @@ class WeatherWindow(QWidget):
         self.app_ref.config["window_size"] = [size.width(), size.height()]
         self.app_ref.save_config()
 
+    def refresh_order(self) -> list[str]:
+        # visible tab first, then tab order; cities without a tab yet go last
+        ordered = self.get_tab_city_order()
+        current = self.city_for_widget(self.tabs.currentWidget())
+        if current in ordered:
+            ordered.remove(current)
+            ordered.insert(0, current)
+        return ordered + [c for c in self.app_ref.cities if c not in ordered]
+
     def get_tab_city_order(self) -> list[str]:
+        by_widget = {data.get("container"): city for city, data in self.city_tabs.items()}
         ordered = []
         for i in range(self.tabs.count()):
-            label = self.tabs.tabText(i)
-            if label == "+":
-                continue
-            for city, data in self.city_tabs.items():
-                if data.get("container") == self.tabs.widget(i):
-                    ordered.append(city)
-                    break
+            city = by_widget.get(self.tabs.widget(i))
+            if city is not None:
+                ordered.append(city)
         return ordered
 
     # ---------- Tabs ----------
@@ -160,11 +260,14 @@ class WeatherWindow(QWidget):
         lay = QVBoxLayout(container)
         lay.setContentsMargins(0, 8, 0, 8)
         lay.setSpacing(0)
-        card = GlassCard(self.app_ref)
-        lay.addWidget(card)
-        lay.addSpacing(8)  # fixed spacing (no dark band)
+        lay.addSpacing(8)  # fixed spacing (no dark band); the card is inserted above it on first show
         idx = self.tabs.count() - 1 if self.has_fake_tab() else self.tabs.count()
+        self.city_tabs[city] = {"card": None, "container": container, "city": city, "last_seen": 0.0}
         self.tabs.insertTab(idx, container, city)
+        if self.overview is not None:
+            self.sync_overview()
+
+    def make_close_button(self):
         close_btn = QToolButton()
         close_btn.setText("x")
         close_btn.setToolTip("Close tab")
@@ -184,25 +287,47 @@ class WeatherWindow(QWidget):
                 border-radius: 11px;
             }
         """)
-        close_btn.clicked.connect(lambda _, w=container: self.remove_tab_by_widget(w))
-        self.tabs.tabBar().setTabButton(idx, QTabBar.ButtonPosition.RightSide, close_btn)
-        self.city_tabs[city] = {"card": card, "container": container, "city": city}
+        close_btn.clicked.connect(lambda: self.remove_tab_by_widget(self.close_btn_owner))
+        close_btn.hide()
+        return close_btn
+
+    def place_close_button(self):
+        widget = self.tabs.currentWidget()
+        if widget is self.close_btn_owner:
+            return
+        bar = self.tabs.tabBar()
+        old_idx = self.tabs.indexOf(self.close_btn_owner) if self.close_btn_owner is not None else -1
+        if old_idx != -1:
+            bar.setTabButton(old_idx, QTabBar.ButtonPosition.RightSide, None)
+        self.close_btn_owner = None
+        self.close_btn.hide()
+        if self.city_for_widget(widget) is not None:
+            bar.setTabButton(self.tabs.indexOf(widget), QTabBar.ButtonPosition.RightSide, self.close_btn)
+            self.close_btn_owner = widget
 
     def remove_tab_by_widget(self, widget):
+        if widget is None:
+            return
         idx = self.tabs.indexOf(widget)
         if idx != -1:
             self.remove_tab(idx)
 
     def remove_tab(self, index):
-        city = self.tabs.tabText(index)
         widget = self.tabs.widget(index)
-        if city in self.app_ref.jobs:
-            self.app_ref.cleanup_job(city)
+        city = self.city_for_widget(widget) or self.tabs.tabText(index)
+        if widget is self.close_btn_owner:
+            # detach the shared button first so it is not deleted along with the tab
+            self.tabs.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+            self.close_btn.setParent(self)
+            self.close_btn.hide()
+            self.close_btn_owner = None
         if city in self.city_tabs:
             del self.city_tabs[city]
+        forecast_store.discard(city)
         self.tabs.removeTab(index)
         if widget:
             widget.deleteLater()
+        self.sync_overview()
         if city in self.app_ref.cities:
             self.app_ref.cities.remove(city)
             self.app_ref.save_config()
@@ -228,79 +353,168 @@ class WeatherWindow(QWidget):
             if self.tabs.count() > 1:
                 self.tabs.setCurrentIndex(0)
 
+    # ---------- Lazy Cards ----------
+    def city_for_widget(self, widget):
+        for city, data in self.city_tabs.items():
+            if data.get("container") is widget:
+                return city
+        return None
+
+    def ensure_card(self, city):
+        data = self.city_tabs[city]
+        data["last_seen"] = time.monotonic()
+        card = data.get("card")
+        if card is not None:
+            return card
+        card = self.recycle_card(exclude=city) or GlassCard(self.app_ref)
+        data["container"].layout().insertWidget(0, card)
+        card.setVisible(True)
+        data["card"] = card
+        if "info" in data:
+            self.render_card(card, city, data["info"])
+        else:
+            card.city_lbl.setText(city)
+        return card
+
+    def recycle_card(self, exclude=None):
+        cap = self.app_ref.config.get("max_live_cards", 0)
+        live = [(c, d) for c, d in self.city_tabs.items() if d.get("card") is not None and c != exclude]
+        if not cap or len(live) < cap:
+            return None
+        city, data = min(live, key=lambda item: item[1].get("last_seen", 0.0))
+        card = data["card"]
+        data["card"] = None
+        data["container"].layout().removeWidget(card)
+        card.reset()
+        log(f"Recycled card of {city} (cap {cap})")
+        return card
+
     # ---------- Update Cards ----------
+    @timed("update_city_tab")
     def update_city_tab(self, city, info):
         if city not in self.city_tabs:
             return
         data = self.city_tabs[city]
+        data["info"] = info
+        tab_idx = self.tabs.indexOf(data["container"])
+        tab_text = info.get("city", city)
+        if tab_idx != -1 and self.tabs.tabText(tab_idx) != tab_text:
+            self.tabs.setTabText(tab_idx, tab_text)
+        self.update_tray(city, info)
+        if self.overview is not None:
+            self.overview.model_.update_city(city, info)
+
         card = data.get("card")
         if not card or not hasattr(card, "city_lbl"):
             return
+        self.render_card(card, city, info)
 
-        self.city_tabs[city]["info"] = info
-        temp_label, wind_label = ("C", "km/h") if self.app_ref.units == "metric" else ("F", "mph")
-        tab_idx = self.tabs.indexOf(data["container"])
-        if tab_idx != -1:
-            self.tabs.setTabText(tab_idx, info.get("city", city))
-
-        card.city_lbl.setText(info.get("city", city))
-        t = info.get("temp")
-        card.temp_lbl.setText(f"{t:.1f}°{temp_label}" if isinstance(t, (int, float)) else "-°")
-        card.desc_lbl.setText(info.get("desc", "-").capitalize())
-        f = info.get("feels_like", "-")
+    def rerender(self):
+        # a display setting (units, theme) changed: re-render from the stored observations, nothing is refetched
+        for city, data in self.city_tabs.items():
+            info = data.get("info")
+            if info is None:
+                continue
+            self.update_tray(city, info)
+            card = data.get("card")
+            if card and hasattr(card, "city_lbl"):
+                self.render_card(card, city, info)
+        if self.overview is not None:
+            self.overview.viewport().update()
+
+    def render_card(self, card, city, info):
+        # info holds °C and m/s; converting here makes a units switch a pure re-render
+        display = self.app_ref.units
+        temp_label, wind_label = units.labels(display)
+        card.set_label("city_lbl", info.get("city", city))
+        t = units.temp(info.get("temp"), display)
+        card.set_label("temp_lbl", f"{t:.1f}°{temp_label}" if t is not None else "-°")
+        card.set_label("desc_lbl", info.get("desc", "-").capitalize())
+        f = units.fmt(units.temp(info.get("feels_like"), display))
         h = info.get("humidity", "-")
-        w = info.get("wind_speed", "-")
-        H = info.get("high", "-")
-        L = info.get("low", "-")
-        card.more_lbl.setText(card.themed_detail_html(f, H, L, h, w, temp_label, wind_label))
+        w = units.fmt(units.wind(info.get("wind_speed"), display))
+        H = units.fmt(units.temp(info.get("high"), display))
+        L = units.fmt(units.temp(info.get("low"), display))
+        # the detail HTML is only rebuilt when one of its inputs (values, units or theme colors) moved
+        detail_key = (f, H, L, h, w, temp_label, wind_label, tuple(card._colors.values()))
+        if card.rendered.get("more_lbl.key") != detail_key:
+            card.set_label("more_lbl", card.themed_detail_html(f, H, L, h, w, temp_label, wind_label))
+            card.rendered["more_lbl.key"] = detail_key
         card.tz_offset = info.get("timezone", 0)
+        card.fetched_at = info.get("fetched_at")
+        card.fetch_error = info.get("error")
         self.update_card_time(card)
-        if not hasattr(card, "time_timer"):
-            card.time_timer = QTimer(card)
-            card.time_timer.timeout.connect(lambda c=card: self.update_card_time(c))
-            card.time_timer.start(60000)
-        emoji = info.get("icon", "🌍")
-        s = max(120, min(220, int(self.height() * 0.4)))
-        card.icon_lbl.setPixmap(QPixmap())
-        card.icon_lbl.setText(emoji)
-        card.icon_lbl.setFont(QFont("Segoe UI Emoji", int(s * 0.8)))
-        card.icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card.set_icon(info.get("icon", "🌍"))
+        self.update_card_scaling(card)
+
+    def update_tray(self, city, info):
         if getattr(self.app_ref, "tray", None) and self.app_ref.cities:
             first_city = self.app_ref.cities[0]
             if city == first_city:
+                tray = self.app_ref.tray
                 emoji_tray = info.get("icon") or "🌍"
-                t = info.get("temp")
-                tt_temp = f"{t:.1f}°" if isinstance(t, (int, float)) else "-°"
-                self.app_ref.tray.setIcon(QIcon())
-                self.app_ref.tray.setIcon(create_tray_icon(emoji_tray))
-                self.app_ref.tray.setToolTip(
-                    f"{info.get('city', first_city)} • {info.get('desc', '-').capitalize()} • {tt_temp}"
-                )
-        self.update_card_scaling()
+                t = units.temp(info.get("temp"), self.app_ref.units)
+                tt_temp = f"{t:.1f}°" if t is not None else "-°"
+                tooltip = f"{info.get('city', first_city)} • {info.get('desc', '-').capitalize()} • {tt_temp}"
+                if emoji_tray != self.tray_icon_key:
+                    tray.setIcon(QIcon())
+                    tray.setIcon(create_tray_icon(emoji_tray))
+                    self.tray_icon_key = emoji_tray
+                if tooltip != self.tray_tooltip:
+                    tray.setToolTip(tooltip)
+                    self.tray_tooltip = tooltip
 
     def update_card_time(self, card):
+        if card is None:
+            return
         fmt_24h = self.app_ref.config.get("time_format_24h", True)
         now_utc = datetime.now(timezone.utc)
+        card.clock_minute = int(now_utc.timestamp() // 60)
         dt = now_utc + timedelta(seconds=getattr(card, "tz_offset", 0))
         timestr = dt.strftime("%H:%M") if fmt_24h else dt.strftime("%I:%M %p")
-        card.time_lbl.setText(f"🕒 {timestr}")
+        card.set_label("time_lbl", f"🕒 {timestr}")
+        self.update_card_age(card)
 
-    def update_card_scaling(self):
-        if not hasattr(self, "city_tabs"):
+    def update_card_age(self, card):
+        fetched_at = getattr(card, "fetched_at", None)
+        error = getattr(card, "fetch_error", None)
+        if not fetched_at:
+            card.set_label("age_lbl", "")
+            card.set_tooltip("age_lbl", "")
             return
+        text = f"· updated {format_age(time.time() - fetched_at)}"
+        card.set_label("age_lbl", f"⚠️ {text}" if error else text)
+        card.set_tooltip("age_lbl", f"Refresh failed: {error}" if error else "")
+
+    def current_card(self):
+        city = self.city_for_widget(self.tabs.currentWidget())
+        return self.city_tabs[city].get("card") if city else None
+
+    def scale_key(self):
         base = max(10, self.height() // 30)
-        for city, data in list(self.city_tabs.items()):
-            try:
-                card: GlassCard = data.get("card")
-                if not card or not hasattr(card, "city_lbl"):
-                    continue
-                card.city_lbl.setFont(QFont("Segoe UI", base + 10, QFont.Weight.Bold))
-                card.temp_lbl.setFont(QFont("Segoe UI", base + 26, QFont.Weight.DemiBold))
-                card.desc_lbl.setFont(QFont("Segoe UI", base + 4))
-                card.more_lbl.setFont(QFont("Segoe UI", base + 2))
-                card.time_lbl.setFont(QFont("Segoe UI", max(12, base + 2)))
-                iw = max(160, min(260, int(self.width() * 0.22)))
-                card.icon_lbl.setMinimumWidth(iw)
-            except RuntimeError as e:
-                log(f"Ignored scaling for deleted card {city}: {e}", "DEBUG")
-                continue
+        iw = max(160, min(260, int(self.width() * 0.22)))
+        # icon sizes snap to 8px steps so live resizing reuses a handful of cached glow pixmaps
+        icon = max(120, min(220, int(self.height() * 0.4))) * 4 // 3 // 8 * 8
+        return base, iw, icon
+
+    @timed("update_card_scaling")
+    def update_card_scaling(self, card=None):
+        # fonts only change when the height bucket moves, so cards remember the key they were scaled for
+        if card is None or not hasattr(card, "city_lbl"):
+            return
+        key = self.scale_key()
+        if card.scale_key == key:
+            return
+        base, iw, icon = key
+        try:
+            card.city_lbl.setFont(cached_font("Segoe UI", base + 10, QFont.Weight.Bold))
+            card.temp_lbl.setFont(cached_font("Segoe UI", base + 26, QFont.Weight.DemiBold))
+            card.desc_lbl.setFont(cached_font("Segoe UI", base + 4))
+            card.more_lbl.setFont(cached_font("Segoe UI", base + 2))
+            card.time_lbl.setFont(cached_font("Segoe UI", max(12, base + 2)))
+            card.age_lbl.setFont(cached_font("Segoe UI", max(10, base)))
+            card.icon_lbl.setMinimumWidth(iw)
+            card.set_icon(card.glyph, icon)
+            card.scale_key = key
+        except RuntimeError as e:
+            log(f"Ignored scaling for deleted card: {e}", "DEBUG")
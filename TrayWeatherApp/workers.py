@@ -1,8 +1,12 @@
 # TrayWeatherApp module: workers.py
-from datetime import datetime, timezone, timedelta
-from PyQt6.QtCore import QObject, pyqtSignal
-from TrayWeatherApp.config_utils import log
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from TrayWeatherApp.common import log
+from TrayWeatherApp.units import localize_info
+from TrayWeatherApp.ratelimit import stop_waiting
+from TrayWeatherApp.engine import (
+    BATCH_CHUNK_SIZE, FETCH_CONCURRENCY, map_weather_code, weather_icons, fetch_city, fetch_batch
+)
 
 # ---------- Weather Worker ----------
 class WeatherWorker(QObject):
@@ -16,92 +20,105 @@ class WeatherWorker(QObject):
 
     def run(self):
         try:
-            geo_url = "https://geocoding-api.open-meteo.com/v1/search"
-            rg = requests.get(geo_url, params={"name": self.city, "count": 1}, timeout=10)
-            if rg.status_code != 200:
-                self.error.emit(self.city, f"Geocode error {rg.status_code}")
-                return
-            geo = rg.json().get("results", [])
-            if not geo:
-                self.error.emit(self.city, f"City not found: {self.city}")
-                return
-
-            loc = geo[0]
-            lat, lon = loc["latitude"], loc["longitude"]
-            city_name = loc.get("name", self.city)
-            country_code = loc.get("country_code") or loc.get("country", "")
-            display_name = f"{city_name}, {country_code}".strip().strip(",")
-
-            temp_unit = "celsius" if self.units == "metric" else "fahrenheit"
-            wind_unit = "kmh" if self.units == "metric" else "mph"
-
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "current": [
-                    "temperature_2m", "apparent_temperature",
-                    "relative_humidity_2m", "wind_speed_10m", "weather_code"
-                ],
-                "daily": ["temperature_2m_max", "temperature_2m_min", "weather_code"],
-                "timezone": "auto",
-                "temperature_unit": temp_unit,
-                "wind_speed_unit": wind_unit,
-            }
-
-            r = requests.get(url, params=params, timeout=10)
-            if r.status_code != 200:
-                self.error.emit(self.city, f"Weather API error {r.status_code}")
-                return
-            d = r.json()
-            cur, daily = d.get("current", {}), d.get("daily", {})
-
-            tz_offset = d.get("utc_offset_seconds", 0)
-            local_time = datetime.utcnow() + timedelta(seconds=tz_offset)
-            hour = local_time.hour
-            is_night = hour < 6 or hour >= 18
-
-            desc, emoji = self.map_weather_code(cur.get("weather_code"), is_night=is_night)
-
-            info = {
-                "city": display_name,
-                "temp": cur.get("temperature_2m"),
-                "feels_like": cur.get("apparent_temperature"),
-                "humidity": cur.get("relative_humidity_2m"),
-                "wind_speed": cur.get("wind_speed_10m"),
-                "desc": desc,
-                "icon": emoji,
-                "timezone": tz_offset,
-                "high": (daily.get("temperature_2m_max") or [None])[0],
-                "low": (daily.get("temperature_2m_min") or [None])[0],
-            }
-            self.finished.emit(self.city, info)
-
+            self.finished.emit(self.city, localize_info(fetch_city(self.city), self.units))
         except Exception as e:
             self.error.emit(self.city, str(e))
 
     def map_weather_code(self, code: int | None, is_night=False):
-        if code is None:
-            return ("Unknown", "🌍")
-
-        mapping = {
-            0: ("Clear sky", "🌙" if is_night else "☀️"),
-            1: ("Mainly clear", "🌙" if is_night else "🌤️"),
-            2: ("Partly cloudy", "☁️" if is_night else "⛅"),
-            3: ("Overcast", "☁️"),
-            45: ("Fog", "🌫️"),
-            48: ("Rime fog", "🌫️"),
-            51: ("Light drizzle", "🌦️"),
-            53: ("Drizzle", "🌧️"),
-            55: ("Heavy drizzle", "🌧️"),
-            61: ("Light rain", "🌦️"),
-            63: ("Rain", "🌧️"),
-            65: ("Heavy rain", "🌧️"),
-            71: ("Light snow", "🌨️"),
-            73: ("Snow", "❄️"),
-            75: ("Heavy snow", "❄️"),
-            95: ("Thunderstorm", "⛈️"),
-        }
-
-        return mapping.get(code, ("Unknown", "🌍"))
+        return map_weather_code(code, is_night)
+
+# ---------- Fetch Executor ----------
+class FetchExecutor(QObject):
+    finished = pyqtSignal(str, object)
+    error = pyqtSignal(str, str)
+    job_done = pyqtSignal(str)
+    # cities asked for again while in flight, emitted once their job ends
+    followup = pyqtSignal(list)
+    # emitted from pool threads, re-emitted on the GUI thread through queued connections
+    _result = pyqtSignal(str, object)
+    _failed = pyqtSignal(str, str)
+    _done = pyqtSignal(str)
+
+    BATCH_PREFIX = "*batch*"
+
+    def __init__(self, max_workers: int = FETCH_CONCURRENCY, parent=None):
+        super().__init__(parent)
+        self.max_workers = max(1, int(max_workers))
+        self.pending = set()
+        # city -> key of the job fetching it; a city asked for again meanwhile gets one follow-up
+        self.in_flight = {}
+        self.followups = set()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="weather-fetch")
+        queued = Qt.ConnectionType.QueuedConnection
+        self._result.connect(self.finished, queued)
+        self._failed.connect(self.error, queued)
+        self._done.connect(self._on_done, queued)
+
+    def is_pending(self, key: str) -> bool:
+        return key in self.pending
+
+    def submit(self, key: str, fn, *args) -> bool:
+        if key in self.pending:
+            return False
+        self.pending.add(key)
+        self._pool.submit(self._run, key, fn, args)
+        return True
+
+    def claim(self, cities: list[str]) -> list[str]:
+        # cities already being fetched are not sent twice, they are refreshed again once that job ends
+        fresh = []
+        for city in cities:
+            if city in self.in_flight:
+                self.followups.add(city)
+            elif city not in fresh:
+                fresh.append(city)
+        return fresh
+
+    def submit_city(self, city: str) -> bool:
+        if not self.claim([city]):
+            return False
+        self.in_flight[city] = city
+        return self.submit(city, self._city_job, city)
+
+    def submit_batch(self, cities: list[str], chunk_size: int = BATCH_CHUNK_SIZE) -> bool:
+        chunk_size = max(1, int(chunk_size))
+        cities = self.claim(cities)
+        submitted = False
+        for i in range(0, len(cities), chunk_size):
+            chunk = cities[i:i + chunk_size]
+            key = self.BATCH_PREFIX + "|".join(chunk)
+            if self.submit(key, fetch_batch, chunk, self._result.emit, self._failed.emit):
+                self.in_flight.update(dict.fromkeys(chunk, key))
+                submitted = True
+        return submitted
+
+    def _city_job(self, city: str):
+        try:
+            self._result.emit(city, fetch_city(city))
+        except Exception as e:
+            self._failed.emit(city, str(e))
+
+    def _run(self, key: str, fn, args):
+        try:
+            fn(*args)
+        except Exception as e:
+            log(f"Fetch job {key} crashed: {e}", "ERROR")
+        finally:
+            self._done.emit(key)
+
+    def _on_done(self, key: str):
+        self.pending.discard(key)
+        released = [city for city, k in self.in_flight.items() if k == key]
+        for city in released:
+            del self.in_flight[city]
+        due = [city for city in released if city in self.followups]
+        if due:
+            self.followups.difference_update(due)
+            log(f"Follow-up refresh of {len(due)} cities requested while in flight")
+            self.followup.emit(due)
+        self.job_done.emit(key)
 
+    def shutdown(self):
+        # running jobs cannot be cancelled, but they stop sleeping in the limiter and exit quickly
+        stop_waiting()
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,92 @@
+# benchmarks module: run.py
+# python -m benchmarks.run [--sizes 1 10 100 500] [--latency-ms 40] [--output bench.json]
+
+from pathlib import Path
+from benchmarks.stub_server import StubOpenMeteo
+import argparse, json, os, platform, subprocess, sys, tempfile, time
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = (1, 10, 100, 500)
+
+def city_names(count: int) -> list[str]:
+    return [f"Bench City {i:04d}" for i in range(count)]
+
+def prepare_home(home: Path, cities: list[str], seed_geocodes: bool):
+    data_dir = home / ".TrayWeatherApp"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    config = {"cities": cities, "units": "metric", "debug": False, "view_mode": "tabs"}
+    (data_dir / "pyqt_tray_weather.json").write_text(json.dumps(config), encoding="utf-8")
+    if seed_geocodes:
+        # steady-state refreshes hit the geocode cache, so a warm run should measure forecast traffic only
+        now = time.time()
+        entries = {" ".join(c.split()).casefold(): {"loc": StubOpenMeteo.geocode(c), "stored": now, "used": now}
+                   for c in cities}
+        payload = {"version": 1, "entries": entries, "stats": {}}
+        (data_dir / "geocode_cache.json").write_text(json.dumps(payload), encoding="utf-8")
+
+def run_scenario(stub: StubOpenMeteo, count: int, args) -> dict:
+    with tempfile.TemporaryDirectory(prefix="trayweather-bench-") as tmp:
+        home = Path(tmp)
+        prepare_home(home, city_names(count), seed_geocodes=not args.cold)
+        env = dict(os.environ, HOME=str(home), USERPROFILE=str(home), QT_QPA_PLATFORM="offscreen",
+                   PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+        cmd = [sys.executable, "-m", "benchmarks.scenario", "--cities", str(count),
+               "--cycles", str(args.cycles), "--timeout", str(args.timeout),
+               "--geo-url", stub.geo_url, "--forecast-url", stub.forecast_url,
+               "--stats-url", stub.base_url + "/__stats"]
+        started = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True, timeout=args.timeout + 60)
+        elapsed = time.perf_counter() - started
+    if proc.returncode != 0 or not proc.stdout.strip():
+        return {"cities": count, "failed": True, "returncode": proc.returncode, "stderr": proc.stderr[-2000:]}
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_s"] = round(elapsed, 4)
+    return result
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="TrayWeatherApp refresh benchmarks against a local stub server")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cycles", type=int, default=2, help="refresh cycles per size (first is cold)")
+    parser.add_argument("--latency-ms", type=float, default=40)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--extra-bytes", type=int, default=0, help="padding added to every forecast location")
+    parser.add_argument("--cold", action="store_true", help="start without a seeded geocode cache")
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    stub = StubOpenMeteo(latency_ms=args.latency_ms, error_rate=args.error_rate,
+                         error_status=args.error_status, extra_bytes=args.extra_bytes)
+    stub.start()
+    try:
+        results = []
+        for count in args.sizes:
+            print(f"benchmark: {count} cities ...", file=sys.stderr, flush=True)
+            results.append(run_scenario(stub, count, args))
+    finally:
+        stub.stop()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency_ms": args.latency_ms,
+            "error_rate": args.error_rate,
+            "error_status": args.error_status,
+            "extra_bytes": args.extra_bytes,
+            "cold_geocode": args.cold,
+            "cycles": args.cycles,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 1 if any(r.get("failed") or r.get("timed_out") for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
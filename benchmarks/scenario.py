@@ -0,0 +1,170 @@
+# benchmarks module: scenario.py
+# one refresh benchmark in a fresh process; run.py starts it with HOME pointing at a scratch dir
+
+import time
+T0 = time.perf_counter()
+
+from pathlib import Path
+from urllib.request import urlopen
+import argparse, json, os, sys, threading
+
+# ---------- Thread sampling ----------
+def thread_count() -> int:
+    # /proc also sees Qt and urllib3 threads that threading.enumerate() does not
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("Threads:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return threading.active_count()
+
+class ThreadSampler(threading.Thread):
+    def __init__(self, period: float = 0.002):
+        super().__init__(name="bench-sampler", daemon=True)
+        self.period = period
+        self.peak = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak = max(self.peak, thread_count() - 1)
+            time.sleep(self.period)
+
+def stub_stats(url: str) -> dict:
+    with urlopen(url, timeout=5) as r:
+        return json.loads(r.read())
+
+def delta(after: dict, before: dict) -> dict:
+    return {k: after[k] - before.get(k, 0) for k in after}
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+# ---------- Scenario ----------
+def run(args) -> dict:
+    sampler = ThreadSampler()
+    sampler.start()
+
+    from TrayWeatherApp import engine, ratelimit
+    engine.GEO_URL = args.geo_url
+    engine.FORECAST_URL = args.forecast_url
+    # the Open-Meteo quota does not apply to the local stub; back-to-back cycles would otherwise
+    # measure the token bucket instead of the app
+    ratelimit.limiter = ratelimit.TokenBucket(rate=1e9, capacity=1e9)
+
+    from PyQt6.QtCore import QTimer
+    from TrayWeatherApp.app import TrayWeatherApp
+
+    marks = {"first_card_paint_s": None, "first_data_paint_s": None}
+    tab_times = []
+    def patch_widgets():
+        from TrayWeatherApp.ui_components import GlassCard
+        from TrayWeatherApp.weather import WeatherWindow
+        original_paint = GlassCard.paintEvent
+        def paint_event(card, event):
+            original_paint(card, event)
+            now = time.perf_counter() - T0
+            if marks["first_card_paint_s"] is None:
+                marks["first_card_paint_s"] = now
+            if marks["first_data_paint_s"] is None and getattr(card, "fetched_at", None):
+                marks["first_data_paint_s"] = now
+        GlassCard.paintEvent = paint_event
+
+        original_update = WeatherWindow.update_city_tab
+        def update_city_tab(window, city, info):
+            t = time.perf_counter()
+            original_update(window, city, info)
+            tab_times.append(time.perf_counter() - t)
+        WeatherWindow.update_city_tab = update_city_tab
+
+    cycles = []
+    state = {"start": None, "stats": None, "answered": 0, "results": 0, "errors": 0, "timed_out": False}
+    original_fetch = TrayWeatherApp.fetch_weather_now
+    def fetch_weather_now(app):
+        if app.window is None:
+            return original_fetch(app)
+        state.update(start=time.perf_counter(), stats=stub_stats(args.stats_url), answered=0, results=0, errors=0)
+        original_fetch(app)
+    TrayWeatherApp.fetch_weather_now = fetch_weather_now
+
+    original_finish = TrayWeatherApp.finish_startup
+    def finish_startup(app):
+        # the window and fetcher only exist once the deferred startup has run inside the event loop
+        if app.window is not None:
+            return
+        patch_widgets()
+        original_finish(app)
+        app.window.show()
+        app.fetcher.finished.connect(lambda *_: on_answer(True))
+        app.fetcher.error.connect(lambda *_: on_answer(False))
+        app.fetcher.job_done.connect(on_job_done)
+    TrayWeatherApp.finish_startup = finish_startup
+
+    def on_answer(ok: bool):
+        state["answered"] += 1
+        state["results" if ok else "errors"] += 1
+
+    def on_job_done(_key):
+        if state["answered"] < args.cities or a.fetcher.pending:
+            return
+        cycles.append({
+            "wall_s": round(time.perf_counter() - state["start"], 4),
+            "results": state["results"],
+            "errors": state["errors"],
+            "requests": delta(stub_stats(args.stats_url), state["stats"]),
+        })
+        if len(cycles) < args.cycles:
+            QTimer.singleShot(0, a.fetch_weather_now)
+        else:
+            QTimer.singleShot(50, a.app.quit)
+
+    def on_timeout():
+        state["timed_out"] = True
+        a.app.quit()
+
+    a = TrayWeatherApp()
+    tray_visible = time.perf_counter() - T0
+    QTimer.singleShot(int(args.timeout * 1000), on_timeout)
+    a.app.exec()
+    sampler.stopped.set()
+    a.fetcher.shutdown()
+
+    return {
+        "cities": args.cities,
+        "tray_visible_s": round(tray_visible, 4),
+        "first_card_paint_s": marks["first_card_paint_s"] and round(marks["first_card_paint_s"], 4),
+        "first_data_paint_s": marks["first_data_paint_s"] and round(marks["first_data_paint_s"], 4),
+        "cycles": cycles,
+        "timed_out": state["timed_out"],
+        "peak_threads": sampler.peak,
+        "update_city_tab": {
+            "calls": len(tab_times),
+            "total_ms": round(sum(tab_times) * 1000, 3),
+            "p50_ms": round(percentile(tab_times, 0.5) * 1000, 3),
+            "p95_ms": round(percentile(tab_times, 0.95) * 1000, 3),
+            "max_ms": round(max(tab_times, default=0) * 1000, 3),
+        },
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="single TrayWeatherApp refresh benchmark")
+    parser.add_argument("--cities", type=int, required=True)
+    parser.add_argument("--cycles", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--geo-url", required=True)
+    parser.add_argument("--forecast-url", required=True)
+    parser.add_argument("--stats-url", required=True)
+    args = parser.parse_args(argv)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    json.dump(run(args), sys.stdout)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+    # skip interpreter teardown of Qt objects, it only adds noise to the wall time
+    os._exit(0)
+
+if __name__ == "__main__":
+    main()
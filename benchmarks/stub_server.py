@@ -0,0 +1,149 @@
+# benchmarks module: stub_server.py
+# local stand-in for the Open-Meteo geocoding and forecast endpoints
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+import json, random, threading, time, zlib
+
+class StubOpenMeteo:
+    def __init__(self, latency_ms: float = 0, error_rate: float = 0.0, error_status: int = 500,
+                 extra_bytes: int = 0, seed: int = 1):
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.extra_bytes = extra_bytes
+        self.rng = random.Random(seed)
+        self.counts = {"geocode": 0, "forecast": 0, "errors": 0, "locations": 0, "bytes": 0}
+        self._lock = threading.Lock()
+        self._server = None
+
+    # ---------- lifecycle ----------
+    def start(self) -> str:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body go out in separate writes; with Nagle on, every reused keep-alive
+            # connection would stall ~40 ms on delayed ACKs and the harness would measure that
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.handle(self)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="stub-open-meteo", daemon=True).start()
+        return self.base_url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def geo_url(self) -> str:
+        return self.base_url + "/v1/search"
+
+    @property
+    def forecast_url(self) -> str:
+        return self.base_url + "/v1/forecast"
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.counts)
+
+    # ---------- payloads ----------
+    @staticmethod
+    def geocode(name: str) -> dict:
+        h = zlib.crc32(name.casefold().encode("utf-8"))
+        return {
+            "name": name.title(),
+            "latitude": round((h % 17000) / 100 - 85, 4),
+            "longitude": round((h // 17000 % 36000) / 100 - 180, 4),
+            "country_code": "XX",
+            "country": "Stubland",
+            "timezone": "UTC",
+        }
+
+    def forecast(self, lat: float, days: int) -> dict:
+        now = int(time.time()) // 3600 * 3600
+        hours = days * 24
+        hourly_t = [now + i * 3600 for i in range(hours)]
+        daily_t = [now // 86400 * 86400 + i * 86400 for i in range(days)]
+        base = round(lat / 4, 1)
+        d = {
+            "latitude": lat,
+            "utc_offset_seconds": 0,
+            "current": {
+                "temperature_2m": base, "apparent_temperature": base - 1.5,
+                "relative_humidity_2m": 60, "wind_speed_10m": 12.0, "weather_code": 2,
+            },
+            "hourly": {
+                "time": hourly_t,
+                "temperature_2m": [base + (i % 24) / 4 for i in range(hours)],
+                "precipitation": [0.0] * hours,
+                "wind_speed_10m": [10.0] * hours,
+                "weather_code": [(0, 1, 2, 3, 61)[i % 5] for i in range(hours)],
+            },
+            "daily": {
+                "time": daily_t,
+                "temperature_2m_max": [base + 4] * days,
+                "temperature_2m_min": [base - 4] * days,
+                "weather_code": [2] * days,
+            },
+        }
+        if self.extra_bytes:
+            d["padding"] = "x" * self.extra_bytes
+        return d
+
+    # ---------- request handling ----------
+    def handle(self, req: BaseHTTPRequestHandler):
+        url = urlsplit(req.path)
+        q = parse_qs(url.query)
+        if url.path == "/__stats":
+            return self.reply(req, 200, self.snapshot(), count=False)
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            fail = self.error_rate and self.rng.random() < self.error_rate
+            if fail:
+                self.counts["errors"] += 1
+        if url.path.endswith("/search"):
+            with self._lock:
+                self.counts["geocode"] += 1
+            if fail:
+                return self.reply(req, self.error_status, {"error": True, "reason": "stub failure"})
+            name = (q.get("name") or [""])[0]
+            return self.reply(req, 200, {"results": [self.geocode(name)] if name else []})
+        if url.path.endswith("/forecast"):
+            lats = (q.get("latitude") or ["0"])[0].split(",")
+            with self._lock:
+                self.counts["forecast"] += 1
+                self.counts["locations"] += len(lats)
+            if fail:
+                return self.reply(req, self.error_status, {"error": True, "reason": "stub failure"})
+            days = int((q.get("forecast_days") or ["7"])[0])
+            results = [self.forecast(float(lat), days) for lat in lats]
+            return self.reply(req, 200, results if len(results) > 1 else results[0])
+        return self.reply(req, 404, {"error": True, "reason": "not found"})
+
+    def reply(self, req: BaseHTTPRequestHandler, status: int, body, count: bool = True):
+        data = json.dumps(body).encode("utf-8")
+        if count:
+            with self._lock:
+                self.counts["bytes"] += len(data)
+        req.send_response(status)
+        req.send_header("Content-Type", "application/json")
+        req.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            req.send_header("Retry-After", "1")
+        req.end_headers()
+        req.wfile.write(data)